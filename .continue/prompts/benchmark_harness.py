@@ -0,0 +1,84 @@
+import argparse
+import os
+import socket
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from run_multi_prompt import request_chat, run_prompts_concurrently
+from run_metrics import percentile
+
+# Function to start fake_ollama.py in its own process so it does not skew the harness numbers
+def start_fake_server(port, tokens, tokens_per_sec, first_token_delay, error_rate):
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fake_ollama.py')
+    process = subprocess.Popen([
+        sys.executable, script,
+        '--port', str(port),
+        '--tokens', str(tokens),
+        '--tokens-per-sec', str(tokens_per_sec),
+        '--first-token-delay', str(first_token_delay),
+        '--error-rate', str(error_rate),
+    ], stdout=subprocess.DEVNULL)
+
+    # Wait until the server accepts connections
+    deadline = time.time() + 10
+    while time.time() < deadline:
+        try:
+            with socket.create_connection(('127.0.0.1', port), timeout=0.2):
+                return process
+        except OSError:
+            time.sleep(0.05)
+    process.kill()
+    raise RuntimeError(f"Fake Ollama server did not start on port {port}")
+
+# Function to run one benchmark round and collect its numbers
+def run_round(url, requests_count, models, concurrency, stream):
+    jobs = [(f"fake-model-{i % models}", 0, 128, 0.9, 0, 0, f"Benchmark prompt {i}") for i in range(requests_count)]
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    results = run_prompts_concurrently(jobs, max_per_model=concurrency, url=url, stream=stream, send=request_chat)
+    elapsed = time.perf_counter() - start
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    latencies = [result['metrics']['wall_time'] for result in results if 'error' not in result]
+    return {
+        'concurrency': concurrency,
+        'requests': requests_count,
+        'errors': requests_count - len(latencies),
+        'requests_per_sec': requests_count / elapsed,
+        'p50': percentile(latencies, 50),
+        'p95': percentile(latencies, 95),
+        'p99': percentile(latencies, 99),
+        'peak_kib': peak_memory / 1024,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark run_multi_prompt.py against a local fake Ollama server.')
+    parser.add_argument('--port', type=int, default=11435)
+    parser.add_argument('--requests', type=int, default=64, help='Requests per round')
+    parser.add_argument('--models', type=int, default=4, help='Number of fake models the requests are spread over')
+    parser.add_argument('--concurrency', default='1,2,4,8', help='Comma separated per-model concurrency levels')
+    parser.add_argument('--tokens', type=int, default=256, help='Content chunks per response')
+    parser.add_argument('--tokens-per-sec', type=float, default=2000, help='Token rate of the fake server, 0 for unthrottled')
+    parser.add_argument('--first-token-delay', type=float, default=0.05, help='Seconds before the first chunk')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests failed by the fake server')
+    parser.add_argument('--no-stream', action='store_true', help='Benchmark the buffered path instead of the streaming parser')
+    args = parser.parse_args()
+
+    server = start_fake_server(args.port, args.tokens, args.tokens_per_sec, args.first_token_delay, args.error_rate)
+    url = f"http://127.0.0.1:{args.port}/api/chat"
+    try:
+        print(f"{'concurrency':>11} {'req/s':>8} {'p50 s':>8} {'p95 s':>8} {'p99 s':>8} {'errors':>6} {'peak KiB':>9}")
+        for level in [int(value) for value in args.concurrency.split(',')]:
+            row = run_round(url, args.requests, args.models, level, not args.no_stream)
+            print(f"{row['concurrency']:>11} {row['requests_per_sec']:>8.1f} {row['p50'] or 0:>8.3f} {row['p95'] or 0:>8.3f} "
+                  f"{row['p99'] or 0:>8.3f} {row['errors']:>6} {row['peak_kib']:>9.0f}")
+    finally:
+        server.terminate()
+        server.wait()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+import argparse
+import json
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+# Local stand-in for Ollama's /api/chat, streaming NDJSON chunks like the real server
+
+
+class FakeOllamaHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        if self.path != '/api/tags':
+            self.send_error(404)
+            return
+
+        models = [{"name": name, "size": size} for name, size in self.server.options['model_sizes'].items()]
+        body = json.dumps({"models": models}).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        if self.path != '/api/chat':
+            self.send_error(404)
+            return
+
+        length = int(self.headers.get('Content-Length', 0))
+        try:
+            payload = json.loads(self.rfile.read(length))
+        except json.JSONDecodeError:
+            self.send_error(400, 'invalid JSON body')
+            return
+
+        options = self.server.options
+        if random.random() < options['error_rate']:
+            body = json.dumps({"error": "injected failure"}).encode('utf-8')
+            self.send_response(500)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+
+        model = payload.get('model', 'fake-model')
+        start = time.perf_counter()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-ndjson')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+
+        time.sleep(options['first_token_delay'])
+        token_interval = 1 / options['tokens_per_sec'] if options['tokens_per_sec'] > 0 else 0
+        eval_start = time.perf_counter()
+        for i in range(options['tokens']):
+            self.write_chunk(self.chunk(model, f"tok{i} ", False))
+            if token_interval:
+                time.sleep(token_interval)
+        eval_duration = time.perf_counter() - eval_start
+
+        final = self.chunk(model, "", True)
+        final.update({
+            "total_duration": int((time.perf_counter() - start) * 1e9),
+            "load_duration": 0,
+            "prompt_eval_count": len(json.dumps(payload.get('messages', []))) // 4,
+            "prompt_eval_duration": int(options['first_token_delay'] * 1e9),
+            "eval_count": options['tokens'],
+            "eval_duration": int(eval_duration * 1e9),
+        })
+        self.write_chunk(final)
+        # Terminating zero-length chunk
+        self.wfile.write(b'0\r\n\r\n')
+
+    def chunk(self, model, content, done):
+        return {
+            "model": model,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "message": {"role": "assistant", "content": content},
+            "done": done,
+        }
+
+    def write_chunk(self, data):
+        line = (json.dumps(data) + '\n').encode('utf-8')
+        self.wfile.write(f"{len(line):X}\r\n".encode('ascii') + line + b'\r\n')
+        self.wfile.flush()
+
+
+# Function to start the fake server on a background thread
+def start_server(port=11435, tokens=64, tokens_per_sec=0, first_token_delay=0.0, error_rate=0.0, host='127.0.0.1', model_sizes=None):
+    server = ThreadingHTTPServer((host, port), FakeOllamaHandler)
+    server.daemon_threads = True
+    server.options = {
+        'tokens': tokens,
+        'tokens_per_sec': tokens_per_sec,
+        'first_token_delay': first_token_delay,
+        'error_rate': error_rate,
+        'model_sizes': model_sizes or {},
+    }
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve a fake Ollama /api/chat endpoint for tests and benchmarks.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=11435)
+    parser.add_argument('--tokens', type=int, default=64, help='Number of content chunks per response')
+    parser.add_argument('--tokens-per-sec', type=float, default=0, help='Token rate, 0 streams as fast as possible')
+    parser.add_argument('--first-token-delay', type=float, default=0.0, help='Seconds before the first chunk')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests answered with HTTP 500')
+    args = parser.parse_args()
+
+    server = start_server(args.port, args.tokens, args.tokens_per_sec, args.first_token_delay, args.error_rate, args.host)
+    print(f"Fake Ollama listening on http://{args.host}:{args.port}/api/chat", flush=True)
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+import json
+import os
+import threading
+
+
+class JobJournal:
+    def __init__(self, path):
+        """Open a run journal, replaying the cells finished by earlier runs."""
+        self.path = path
+        self._lock = threading.Lock()
+        self._completed = {}
+        complete_last_line = True
+
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as file:
+                for line in file:
+                    complete_last_line = line.endswith('\n')
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # A run killed mid-write leaves at most one partial last line
+                        continue
+                    self._completed[(record['prompt'], record['model'])] = record['result']
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, 'a', encoding='utf-8')
+        if not complete_last_line:
+            # New records start on their own line instead of being glued onto the partial one
+            self._file.write('\n')
+
+    def __contains__(self, cell):
+        return cell in self._completed
+
+    def get(self, cell):
+        """Return the recorded result of a (prompt, model) cell, or None."""
+        return self._completed.get(cell)
+
+    def record(self, cell, result):
+        """Append a finished (prompt, model) cell as one JSON line and flush it to disk."""
+        prompt, model = cell
+        line = json.dumps({"prompt": prompt, "model": model, "result": result}, ensure_ascii=False)
+        with self._lock:
+            self._file.write(line + '\n')
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._completed[cell] = result
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,64 @@
+import requests
+
+# Function to derive an Ollama API URL (e.g. /api/tags) from the /api/chat endpoint
+def api_url(chat_url, path):
+    return chat_url.rsplit('/api/', 1)[0] + path
+
+# Function to read the on-disk size of the pulled models from Ollama's /api/tags
+def fetch_model_sizes(session, chat_url):
+    try:
+        response = session.get(api_url(chat_url, '/api/tags'), timeout=10)
+        response.raise_for_status()
+        models = response.json().get('models', [])
+    except (requests.RequestException, ValueError):
+        return {}
+
+    sizes = {}
+    for model in models:
+        name = model.get('name') or model.get('model')
+        if name and model.get('size'):
+            sizes[name] = model['size']
+            # Configs usually leave out the default tag
+            if name.endswith(':latest'):
+                sizes[name[:-len(':latest')]] = model['size']
+    return sizes
+
+# Function to group models into waves whose combined size fits in the RAM budget
+def plan_waves(models, sizes, ram_budget=None):
+    if not ram_budget:
+        # Without a budget only one model is loaded at a time, so models never evict each other mid-batch
+        return [[model] for model in models]
+
+    # First-fit decreasing: the largest models are placed first, unknown sizes get a wave of their own
+    ordered = sorted(models, key=lambda model: sizes.get(model, ram_budget), reverse=True)
+    waves = []
+    loads = []
+    for model in ordered:
+        size = sizes.get(model, ram_budget)
+        for i, load in enumerate(loads):
+            if load + size <= ram_budget:
+                waves[i].append(model)
+                loads[i] += size
+                break
+        else:
+            waves.append([model])
+            loads.append(size)
+    return waves
+
+# Function to load a model ahead of its batch and keep it resident for keep_alive
+def warm_up(session, chat_url, model, keep_alive):
+    # A chat request without messages only loads the model
+    payload = {'model': model, 'messages': [], 'keep_alive': keep_alive, 'stream': False}
+    try:
+        response = session.post(chat_url, json=payload, timeout=600)
+        return response.status_code == 200
+    except requests.RequestException:
+        return False
+
+# Function to unload a model once its batch is done so the next wave has room
+def unload(session, chat_url, model):
+    payload = {'model': model, 'messages': [], 'keep_alive': 0, 'stream': False}
+    try:
+        session.post(chat_url, json=payload, timeout=60)
+    except requests.RequestException:
+        pass
@@ -0,0 +1,95 @@
+import hashlib
+import json
+import os
+import threading
+
+
+class ResponseCache:
+    def __init__(self, cache_dir='.prompt-cache', max_bytes=256 * 1024 * 1024, refresh=False):
+        """Open (or create) an on-disk response cache bounded to max_bytes."""
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.refresh = refresh
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+
+        # Size of every entry, used to evict without rescanning the directory
+        self._sizes = {}
+        for entry in os.scandir(cache_dir):
+            if entry.is_file() and entry.name.endswith('.json'):
+                self._sizes[entry.path] = entry.stat().st_size
+        self._total = sum(self._sizes.values())
+
+    @staticmethod
+    def make_key(model, temperature, max_tokens, top_p, presence_penalty, frequency_penalty, system_message, user_message):
+        """Hash everything that determines the model's answer into a cache key."""
+        key_data = {
+            "model": model,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "top_p": top_p,
+            "presence_penalty": presence_penalty,
+            "frequency_penalty": frequency_penalty,
+            "system": system_message,
+            "user": user_message,
+        }
+        encoded = json.dumps(key_data, sort_keys=True, ensure_ascii=False).encode('utf-8')
+        return hashlib.sha256(encoded).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key + '.json')
+
+    def __contains__(self, key):
+        """True if key has an entry that get() would return, without reading it."""
+        return not self.refresh and os.path.exists(self._path(key))
+
+    def get(self, key):
+        """Return the cached result for key, or None on a miss or when refreshing."""
+        if self.refresh:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as file:
+                result = json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+        # Touch the entry so eviction sees it as recently used
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        return result
+
+    def put(self, key, result):
+        """Store result under key and evict the least recently used entries over the size limit."""
+        path = self._path(key)
+        data = json.dumps(result, ensure_ascii=False).encode('utf-8')
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as file:
+            file.write(data)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self._total += len(data) - self._sizes.get(path, 0)
+            self._sizes[path] = len(data)
+            if self._total > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        entries = []
+        for path in self._sizes:
+            try:
+                entries.append((os.stat(path).st_mtime, path))
+            except FileNotFoundError:
+                entries.append((0, path))
+        entries.sort()
+
+        for _, path in entries:
+            if self._total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            self._total -= self._sizes.pop(path)
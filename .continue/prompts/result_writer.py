@@ -0,0 +1,52 @@
+import json
+import os
+import threading
+
+
+class ResultWriter:
+    def __init__(self, output_path):
+        """Stream result records to <output_path without .json>.jsonl as they arrive."""
+        self.output_path = output_path
+        self.jsonl_path = os.path.splitext(output_path)[0] + '.jsonl'
+        if os.path.abspath(self.jsonl_path) == os.path.abspath(output_path):
+            # The final JSON array would overwrite the records it is built from
+            raise ValueError(f"{output_path} is reserved for the JSON Lines records, use a .json output name")
+        directory = os.path.dirname(output_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._file = open(self.jsonl_path, 'w', encoding='utf-8')
+        self.count = 0
+
+    def write(self, record):
+        """Serialize one record as a JSON line and flush it."""
+        line = json.dumps(record, ensure_ascii=False)
+        with self._lock:
+            self._file.write(line + '\n')
+            self._file.flush()
+            self.count += 1
+
+    def close(self, head='[\n', tail='\n]\n'):
+        """Close the JSON Lines file and assemble the output file from it, the records as a JSON array between head and tail."""
+        if self._file.closed:
+            return
+        self._file.close()
+
+        # Every line is already valid JSON, so the array is built by copying text, not by re-parsing
+        tmp_path = self.output_path + '.tmp'
+        with open(self.jsonl_path, 'r', encoding='utf-8') as source, open(tmp_path, 'w', encoding='utf-8') as target:
+            target.write(head)
+            first = True
+            for line in source:
+                if not first:
+                    target.write(',\n')
+                target.write(line.rstrip('\n'))
+                first = False
+            target.write(tail)
+        os.replace(tmp_path, self.output_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,50 @@
+import math
+
+# Counters Ollama reports in the final chunk of /api/chat (durations are in nanoseconds)
+OLLAMA_COUNTERS = ['eval_count', 'eval_duration', 'prompt_eval_count', 'prompt_eval_duration', 'load_duration', 'total_duration']
+
+# Function to build the metrics stored next to each response
+def build_metrics(wall_time, ttft, final_chunk, streamed_chunks=0, generation_time=None):
+    metrics = {
+        'wall_time': round(wall_time, 4),
+        'ttft': round(ttft, 4) if ttft is not None else None,
+    }
+    for counter in OLLAMA_COUNTERS:
+        metrics[counter] = final_chunk.get(counter)
+
+    # Prefer Ollama's own generation counters, fall back to counting streamed chunks
+    if metrics['eval_count'] and metrics['eval_duration']:
+        metrics['tokens_per_sec'] = round(metrics['eval_count'] / (metrics['eval_duration'] / 1e9), 2)
+    elif streamed_chunks and generation_time:
+        metrics['tokens_per_sec'] = round(streamed_chunks / generation_time, 2)
+    else:
+        metrics['tokens_per_sec'] = None
+    return metrics
+
+# Function to compute a nearest-rank percentile of a list of numbers
+def percentile(values, q):
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+# Function to summarize the metrics of one model's results with p50/p95, cache hits are counted but not timed
+def summarize_metrics(results, fields=('wall_time', 'ttft', 'tokens_per_sec', 'load_duration')):
+    summary = {'count': 0, 'cached': 0}
+    samples = {field: [] for field in fields}
+    for result in results:
+        metrics = result.get('metrics') if isinstance(result, dict) else None
+        if not metrics:
+            continue
+        if metrics.get('cached'):
+            summary['cached'] += 1
+            continue
+        summary['count'] += 1
+        for field in fields:
+            if metrics.get(field) is not None:
+                samples[field].append(metrics[field])
+
+    for field in fields:
+        summary[field] = {'p50': percentile(samples[field], 50), 'p95': percentile(samples[field], 95)}
+    return summary
@@ -1,10 +1,43 @@
 import requests
 import json
 import os
+import io
+import sys
+import time
+import argparse
+import threading
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from response_cache import ResponseCache
+from job_journal import JobJournal
+from run_metrics import build_metrics, summarize_metrics
+from token_budget import pack_user_message
+from model_scheduler import fetch_model_sizes, plan_waves, warm_up, unload
+from result_writer import ResultWriter
+
+OLLAMA_URL = 'http://localhost:11434/api/chat'  # Ollama's local API endpoint (adjust if using cloud)
+DEFAULT_CONFIG_PATH = os.path.expanduser('~/.continue/config.json')
+DEFAULT_SYSTEM_MESSAGE = "You are a friendly assistant."
+
+# One pooled HTTP session per endpoint, shared by all worker threads
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+def get_session(url, pool_size=16):
+    with _sessions_lock:
+        session = _sessions.get(url)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            _sessions[url] = session
+        return session
 
 def read_config(file_path):
     if not os.path.exists(file_path):
-        print(f"Error: {file_path} does not exist.")
+        print(f"Error: {file_path} does not exist.", file=sys.stderr)
         return None
 
     with open(file_path, 'r') as file:
@@ -12,10 +45,10 @@ def read_config(file_path):
 
     return config_data
 
-# Function to parse the .prompt file
-def parse_prompt_file(file_path, config):
+# Function to read the user message from a .prompt file
+def read_user_message(file_path):
     if not os.path.exists(file_path):
-        print(f"Error: {file_path} does not exist.")
+        print(f"Error: {file_path} does not exist.", file=sys.stderr)
         return None
 
     with open(file_path, 'r') as file:
@@ -23,24 +56,48 @@ def parse_prompt_file(file_path, config):
 
     # Split content into the configuration part and the user message
     parts = content.split('---')
-    
-    # Parse the configuration (YAML format)
+    return parts[2].strip().replace('<user>', '').replace('</user>', '').strip()
+
+# Function to extract the request options of one entry of the config's models list
+def model_options(model_config):
+    completion_options = model_config.get('completionOptions', {})
+    model = model_config['model']
+    temperature = completion_options.get('temperature', 0)
+    max_tokens = completion_options.get('maxTokens', -1)
+    top_p = completion_options.get('topP', 0.9)
+    presence_penalty = completion_options.get('presencePenalty', 0)
+    frequency_penalty = completion_options.get('frequencyPenalty', 0)
+    return model, temperature, max_tokens, top_p, presence_penalty, frequency_penalty
+
+# Function to parse the .prompt file
+def parse_prompt_file(file_path, config, model_index=0):
+    user_message = read_user_message(file_path)
+    if user_message is None:
+        return None
 
     # Extract configuration values
-    model = config_data['models'][0]['model']
-    temperature = config_data['models'][0]['completionOptions']['temperature']
-    max_tokens = config_data['models'][0]['completionOptions']['maxTokens']
-    top_p = config_data['models'][0]['completionOptions']['topP']
-    presence_penalty = config_data['models'][0]['completionOptions']['presencePenalty']
-    frequency_penalty = config_data['models'][0]['completionOptions']['frequencyPenalty']
-    user_message = parts[2].strip().replace('<user>', '').strip()
-    
-    return model, temperature, max_tokens, top_p, presence_penalty, frequency_penalty, user_message
+    return model_options(config['models'][model_index]) + (user_message,)
 
 # Function to send the request to Ollama's API (local or cloud-based endpoint)
-def send_to_ollama_api(model, temperature, max_tokens, top_p, presence_penalty, frequency_penalty, user_message):
-    url = 'http://localhost:11434/api/chat'  # Ollama's local API endpoint (adjust if using cloud)
-    
+def send_to_ollama_api(model, temperature, max_tokens, top_p, presence_penalty, frequency_penalty, user_message, system_message=DEFAULT_SYSTEM_MESSAGE, url=OLLAMA_URL, stream=False, on_token=None, cache=None, keep_alive=None):
+    result = request_chat(model, temperature, max_tokens, top_p, presence_penalty, frequency_penalty, user_message, system_message, url, stream, on_token, cache, keep_alive)
+    if 'error' in result:
+        return f"Error: {result['error']}"
+    return format_result(result['model'], result['created_at'], result['role'], result['content'])
+
+# Function to send the request and return the parsed response as a dictionary
+def request_chat(model, temperature, max_tokens, top_p, presence_penalty, frequency_penalty, user_message, system_message=DEFAULT_SYSTEM_MESSAGE, url=OLLAMA_URL, stream=False, on_token=None, cache=None, keep_alive=None):
+    # Answer unchanged prompt/model cells from the on-disk cache
+    if cache is not None:
+        cache_key = ResponseCache.make_key(model, temperature, max_tokens, top_p, presence_penalty, frequency_penalty, system_message, user_message)
+        start = time.perf_counter()
+        cached = cache.get(cache_key)
+        if cached is not None:
+            # The stored metrics were measured by the run that produced the answer, this one only timed the lookup
+            cached['metrics'] = build_metrics(time.perf_counter() - start, None, {})
+            cached['metrics']['cached'] = True
+            return cached
+
     headers = {
         'Content-Type': 'application/json',  # No token needed for Ollama
     }
@@ -54,39 +111,82 @@ def send_to_ollama_api(model, temperature, max_tokens, top_p, presence_penalty,
         'presence_penalty': presence_penalty,
         'frequency_penalty': frequency_penalty,
         'messages': [
-            {"role": "system", "content": "You are a friendly assistant."},  # System message
+            {"role": "system", "content": system_message},  # System message
             {"role": "user", "content": user_message}  # User message
         ]
     }
-    
-    # Send the request to Ollama's API
-    response = requests.post(url, json=payload, headers=headers)
-    
-    # Check if the request was successful (HTTP 200)
-    if response.status_code == 200:
-        try:
-            formatted_text = format_json(response.text)
-            # Attempt to parse the response as JSON
-            return append_content(json.loads(formatted_text)) # This will return a Python dictionary (JSON)
-        except json.JSONDecodeError:
-            # Handle the case where the response is not valid JSON
-            return f"Error: Response is not in valid JSON format. Response content: {formatted_text}"
-    else:
-        return f"Error: {response.status_code} - {response.text}"
-
-def format_json(text):
-    # Split the text into lines
-    lines = text.splitlines()
-
-    # Add a comma at the end of each line except the last one
-    formatted_lines = [line + ',' if i < len(lines) - 1 else line for i, line in enumerate(lines)]
-
-    # Join the lines with a newline character and wrap with square brackets
-    formatted_text = '[\n' + '\n'.join(formatted_lines) + '\n]'
-
-    return formatted_text
+    if keep_alive is not None:
+        # Keep the model loaded between the requests of its batch
+        payload['keep_alive'] = keep_alive
+
+    try:
+        result = post_chat(url, payload, headers, stream, on_token)
+    except requests.RequestException as e:
+        return {'error': str(e)}
+
+    if cache is not None and 'error' not in result:
+        cache.put(cache_key, result)
+    return result
+
+# Function to post the chat payload and parse the response
+def post_chat(url, payload, headers, stream=False, on_token=None):
+    # Ollama answers with NDJSON either way, so every request is read chunk by chunk and gets its time to first token;
+    # --stream only adds the live output
+    return stream_ollama_chat(url, payload, headers, on_token if stream else None)
+
+# Function to read Ollama's NDJSON chat stream one chunk at a time
+def stream_ollama_chat(url, payload, headers=None, on_token=None):
+    start = time.perf_counter()
+    first_token_at = None
+    chunk_count = 0
+    buffer = io.StringIO()
+    last_chunk = {}
+    role = 'assistant'
+
+    with get_session(url).post(url, json=payload, headers=headers, stream=True) as response:
+        if response.status_code != 200:
+            return {'error': f"{response.status_code} - {response.text}"}
+
+        for line in response.iter_lines():
+            if not line:
+                continue
+            try:
+                chunk = json.loads(line)
+            except json.JSONDecodeError:
+                return {'error': f"Response is not in valid JSON format. Response content: {line!r}"}
+            if 'error' in chunk:
+                return {'error': chunk['error']}
+
+            message = chunk.get('message') or {}
+            content = message.get('content')
+            if content:
+                if first_token_at is None:
+                    first_token_at = time.perf_counter()
+                chunk_count += 1
+                buffer.write(content)
+                if on_token:
+                    on_token(content)
+            role = message.get('role', role)
+            # Only the latest chunk is kept, the final one carries Ollama's counters
+            last_chunk = chunk
+
+    end = time.perf_counter()
+    ttft = first_token_at - start if first_token_at is not None else None
+    generation_time = end - first_token_at if first_token_at is not None else None
+
+    return {
+        'model': last_chunk.get('model', payload['model']),
+        'created_at': last_chunk.get('created_at', ''),
+        'role': role,
+        'content': buffer.getvalue(),
+        'metrics': build_metrics(end - start, ttft, last_chunk, chunk_count, generation_time),
+    }
 
 def append_content(json_data):
+    result = collect_content(json_data)
+    return format_result(result['model'], result['created_at'], result['role'], result['content'])
+
+def collect_content(json_data):
     # Initialize an empty list to store content values
     content_list = []
 
@@ -99,46 +199,279 @@ def append_content(json_data):
 
     # Join the content values into a single line with space separating them
     combined_content = ' '.join(content_list)
-    combined_content = '{\n"name":"'+item['model'].strip()+'",\n"created_at":"'+item['created_at'].strip()+'",\n"prompt": \n{\t"'+item['message']['role'].strip()+'":"' + combined_content+'"\n}}'
-    return combined_content
+    return {
+        'model': item['model'],
+        'created_at': item['created_at'],
+        'role': item['message']['role'],
+        'content': combined_content,
+    }
+
+def result_record(model, created_at, role, content):
+    return {"name": model.strip(), "created_at": created_at.strip(), "prompt": {role.strip(): content}}
+
+def format_result(model, created_at, role, content):
+    # Serialize with the JSON encoder so quotes, backslashes and newlines in answers are escaped
+    return json.dumps(result_record(model, created_at, role, content), indent=4, ensure_ascii=False)
+
+# Function to build the request of one prompt for one model, fitting attached files into its context window
+def build_job(model_config, prompt_file, user_message, system_message=DEFAULT_SYSTEM_MESSAGE, context_root='.'):
+    options = model_options(model_config)
+    packed_message, report = pack_user_message(user_message, system_message, model_config.get('contextLength'), options[2], context_root)
 
-config_file_path = '/Users/athirakm/.continue/config.json'
-config_data = read_config(config_file_path)
+    trimmed = f", trimmed {', '.join(report['trimmed'])}" if report['trimmed'] else ""
+    print(f"{options[0]}: {prompt_file}: system {report['system_tokens']} + user {report['user_tokens']} + files {report['attachment_tokens']} "
+          f"+ output {report['output_tokens']} = ~{report['total_tokens']}/{report['context_length'] or '?'} tokens{trimmed}", file=sys.stderr)
+    return options + (packed_message, system_message)
+
+# Function to run one job and checkpoint its result in the journal
+def run_job(send, job, cell, journal, **kwargs):
+    result = send(*job, **kwargs)
+    failed = isinstance(result, dict) and 'error' in result
+    if journal is not None and not failed:
+        journal.record(cell, result)
+    return result
+
+# Function to run parsed prompts concurrently and yield the results in input order as they become available
+def iter_prompts_concurrently(jobs, max_per_model=1, url=OLLAMA_URL, stream=False, send=send_to_ollama_api, cache=None, journal=None, cells=None, keep_alive=None):
+    # Each model gets its own bounded pool, so a slow model never holds up the others
+    executors = {}
+    futures = []
+    try:
+        for i, job in enumerate(jobs):
+            cell = cells[i] if cells else None
+            # Cells finished by an earlier run are taken from the journal
+            if journal is not None and cell in journal:
+                futures.append(None)
+                continue
+            model = job[0]
+            if model not in executors:
+                executors[model] = ThreadPoolExecutor(max_workers=max_per_model)
+            futures.append(executors[model].submit(run_job, send, job, cell, journal, url=url, stream=stream, cache=cache, keep_alive=keep_alive))
+
+        # Hand out the results in input order and drop each one once it has been consumed
+        for i, future in enumerate(futures):
+            result = future.result() if future is not None else None
+            futures[i] = None
+            # Build the output from the journal, keeping the errors of cells that did not finish
+            if journal is not None and cells[i] in journal:
+                result = journal.get(cells[i])
+            yield result
+    finally:
+        # On Ctrl-C drop the queued jobs, the finished ones are already in the journal
+        for executor in executors.values():
+            executor.shutdown(wait=True, cancel_futures=True)
+
+# Function to run parsed prompts concurrently, at most max_per_model requests in flight per model
+def run_prompts_concurrently(jobs, max_per_model=1, url=OLLAMA_URL, stream=False, send=send_to_ollama_api, cache=None, journal=None, cells=None, keep_alive=None):
+    return list(iter_prompts_concurrently(jobs, max_per_model, url, stream, send, cache, journal, cells, keep_alive))
+
+# Function to check whether a job's answer is already in the journal or the response cache
+def is_answered(job, cell, cache=None, journal=None):
+    if journal is not None and cell in journal:
+        return True
+    if cache is None:
+        return False
+    model, temperature, max_tokens, top_p, presence_penalty, frequency_penalty, user_message, system_message = job
+    return ResponseCache.make_key(model, temperature, max_tokens, top_p, presence_penalty, frequency_penalty, system_message, user_message) in cache
+
+# Function to run the jobs one wave of models at a time, loading each model once, and yield (job index, result) pairs
+def run_in_waves(jobs, cells, max_per_model=1, url=OLLAMA_URL, stream=False, cache=None, journal=None, ram_budget=None, keep_alive='10m'):
+    session = get_session(url)
+    models = list(dict.fromkeys(job[0] for job in jobs))
+    sizes = fetch_model_sizes(session, url) if ram_budget else {}
+    waves = plan_waves(models, sizes, ram_budget)
+
+    for wave in waves:
+        indices = [i for i, job in enumerate(jobs) if job[0] in wave]
+
+        # Warm up the models that still have cells to ask, in parallel; an all-cached model is never loaded
+        pending_models = {jobs[i][0] for i in indices if not is_answered(jobs[i], cells[i], cache, journal)}
+        if pending_models:
+            with ThreadPoolExecutor(max_workers=len(pending_models)) as executor:
+                list(executor.map(lambda model: warm_up(session, url, model, keep_alive), pending_models))
+
+        wave_results = iter_prompts_concurrently([jobs[i] for i in indices], max_per_model=max_per_model, url=url, stream=stream,
+                                                 send=request_chat, cache=cache, journal=journal,
+                                                 cells=[cells[i] for i in indices], keep_alive=keep_alive)
+        yield from zip(indices, wave_results)
+
+        # Free the RAM for the next wave
+        if len(waves) > 1:
+            for model in pending_models:
+                unload(session, url, model)
 
 # Function to process multiple prompt files
-def process_multiple_prompts(prompt_files):
-    print('[')
-    count=0
-    for prompt_file in prompt_files:
-        count = count+1
+def process_multiple_prompts(prompt_files, config_data, max_per_model=1, stream=False, cache=None, journal=None, context_root='.', output_path=None):
+    jobs = []
+    cells = []
+    missing = {}
+    for position, prompt_file in enumerate(prompt_files):
         if os.path.exists(prompt_file):
             # Parse the .prompt file
-            model, temperature, max_tokens, top_p, presence_penalty, frequency_penalty, user_message = parse_prompt_file(prompt_file, config_data)
+            user_message = read_user_message(prompt_file)
+            job = build_job(config_data['models'][0], prompt_file, user_message, context_root=context_root)
+            jobs.append(job)
+            cells.append((prompt_file, job[0]))
+        else:
+            # Reported as a record of the output, so stdout stays one JSON array
+            print(f"Error: {prompt_file} does not exist.", file=sys.stderr)
+            missing[position] = {"name": config_data['models'][0]['model'], "prompt_file": prompt_file, "error": f"{prompt_file} does not exist."}
 
-            # Get the response from Ollama API
-            response = send_to_ollama_api(model, temperature, max_tokens, top_p, presence_penalty, frequency_penalty, user_message)
+    # Stream the responses to the output file, or to stdout as a JSON array, in the order of the prompt files
+    writer = ResultWriter(output_path) if output_path else None
+    if writer is None:
+        print('[')
+    try:
+        results = zip(cells, iter_prompts_concurrently(jobs, max_per_model=max_per_model, stream=stream, send=request_chat, cache=cache, journal=journal, cells=cells))
+        for i in range(len(prompt_files)):
+            cell, result = (None, None) if i in missing else next(results)
+            if i in missing:
+                record = missing[i]
+            elif 'error' in result:
+                record = {"name": cell[1], "prompt_file": cell[0], "error": result['error']}
+            else:
+                record = result_record(result['model'], result['created_at'], result['role'], result['content'])
+                record["metrics"] = result.get('metrics')
+                if stream:
+                    metrics = result['metrics']
+                    ttft = metrics['ttft'] if metrics['ttft'] is not None else float('nan')
+                    print(f"{result['model']}: time to first token {ttft:.2f}s, {metrics['tokens_per_sec'] or 0:.1f} tokens/s", file=sys.stderr)
 
-            # Print the response (it should now be a Python dictionary)
-            if count != len(prompt_files):
-                print(response+',')  # This will print the response as a Python dictionary (JSON)
+            if writer is not None:
+                writer.write(record)
             else:
-                print(response)
+                separator = ',' if i < len(prompt_files) - 1 else ''
+                print(json.dumps(record, indent=4, ensure_ascii=False) + separator, flush=True)
+    finally:
+        if writer is not None:
+            writer.close()
+            print(f"Wrote {writer.count} results to {writer.output_path} and {writer.jsonl_path}")
         else:
-            print(f"Error: {prompt_file} does not exist.")
-    print(']')
+            print(']')
+
+# Function to load the models list of one or more Continue config files, keeping the first entry of each model
+def load_models(config_paths):
+    models = {}
+    for config_path in config_paths:
+        config = read_config(config_path)
+        if config:
+            for model in config.get('models', []):
+                # A model listed twice would get two writers on the same result file and be asked twice
+                models.setdefault(model['model'], model)
+    return list(models.values())
+
+# Function to build the result file path in the prompt-results/<model>/<model>_<timestamp>.json layout
+def result_file_path(output_dir, model, timestamp):
+    model_name = model.replace('/', '_')
+    return os.path.join(output_dir, model_name, f"{model_name}_{timestamp}.json")
+
+# Function to run every prompt file against every model and write one result file per model
+def run_sweep(models, prompt_files, output_dir, max_per_model=1, stream=False, url=OLLAMA_URL, cache=None, journal=None, context_root='.', ram_budget=None, keep_alive='10m'):
+    # Parse the prompt files once for the whole grid
+    names = []
+    messages = []
+    for prompt_file in prompt_files:
+        user_message = read_user_message(prompt_file)
+        if user_message is not None:
+            names.append(prompt_file)
+            messages.append(user_message)
+
+    jobs = []
+    cells = []
+    for model_config in models:
+        system_message = model_config.get('systemMessage', DEFAULT_SYSTEM_MESSAGE)
+        for prompt_file, user_message in zip(names, messages):
+            jobs.append(build_job(model_config, prompt_file, user_message, system_message, context_root))
+            cells.append((prompt_file, model_config['model']))
+
+    # Each model's answers go to disk as its cells finish; only their metrics are kept for the summary
+    timestamp = datetime.now().strftime('%Y%m%dT%H%M%S')
+    file_paths = [result_file_path(output_dir, model_config['model'], timestamp) for model_config in models]
+    writers = [ResultWriter(file_path) for file_path in file_paths]
+    metrics = [[] for _ in models]
+    open_models = set(range(len(models)))
+    try:
+        results = run_in_waves(jobs, cells, max_per_model=max_per_model, url=url, stream=stream, cache=cache, journal=journal,
+                               ram_budget=ram_budget, keep_alive=keep_alive)
+        for i, result in results:
+            # The jobs are in model order, so each model owns one contiguous slice of len(messages) cells
+            model_index, prompt_index = divmod(i, len(messages))
+            writers[model_index].write({
+                "user": messages[prompt_index],
+                "assistant": result.get('content', f"Error: {result.get('error')}"),
+                "metrics": result.get('metrics'),
+            })
+            metrics[model_index].append({'metrics': result.get('metrics')})
+            if prompt_index == len(messages) - 1:
+                close_sweep_file(writers[model_index], models[model_index]['model'], timestamp, metrics[model_index])
+                open_models.discard(model_index)
+    finally:
+        # An interrupted sweep still leaves valid files holding the answers finished so far
+        for model_index in sorted(open_models):
+            close_sweep_file(writers[model_index], models[model_index]['model'], timestamp, metrics[model_index])
+    return file_paths
+
+# Function to assemble a model's {"0": [run]} result file from its streamed answers and print its latency summary
+def close_sweep_file(writer, model, timestamp, metrics):
+    summary = summarize_metrics(metrics)
+    run = {"name": model, "created_at": timestamp, "file_name": os.path.basename(writer.output_path)}
+    # The answers are copied in from the JSON Lines file, only the envelope around them is built here
+    head = '{"0": [' + json.dumps(run, ensure_ascii=False)[:-1] + ', "prompt": [\n'
+    tail = '\n], "metrics_summary": ' + json.dumps(summary) + '}]}\n'
+    writer.close(head, tail)
+    print(f"{model}: {summary['count']} timed responses, {summary['cached']} from the cache, wall time p50 {summary['wall_time']['p50']}s p95 {summary['wall_time']['p95']}s, "
+          f"tokens/s p50 {summary['tokens_per_sec']['p50']}", file=sys.stderr)
 
 # Main function
 def main():
-    if config_data:
-    # List of .prompt files to process
-        prompt_files = [
-            
-            'port.prompt'
-           
-        ]
+    parser = argparse.ArgumentParser(description='Send .prompt files to Ollama and print the responses as JSON.')
+    parser.add_argument('prompt_files', nargs='*', default=['port.prompt'], help='List of .prompt files to process')
+    parser.add_argument('--config', action='append', help='Continue config file, may be given more than once (default: ~/.continue/config.json)')
+    parser.add_argument('--sweep', action='store_true', help='Run every prompt against every model in the config and write one result file per model')
+    parser.add_argument('--output-dir', default='prompt-results', help='Directory for the per-model result files written by --sweep')
+    parser.add_argument('--max-per-model', type=int, default=1, help='Maximum concurrent requests per model')
+    parser.add_argument('--stream', action='store_true', help='Report the time to first token and tokens/sec of each response as it arrives')
+    parser.add_argument('--cache-dir', default='.prompt-cache', help='Directory of the on-disk response cache')
+    parser.add_argument('--cache-size', type=int, default=256, help='Maximum size of the response cache in MB')
+    parser.add_argument('--refresh', action='store_true', help='Ignore cached responses and query the models again')
+    parser.add_argument('--no-cache', action='store_true', help='Disable the response cache')
+    parser.add_argument('--context-root', default='.', help='Directory the @file references of the prompts are resolved against')
+    parser.add_argument('--ram-budget', type=float, help='GB of RAM for loaded models; --sweep lets models that fit together share a wave (default: one model at a time)')
+    parser.add_argument('--keep-alive', default='10m', help='How long Ollama keeps a model loaded during its batch')
+    parser.add_argument('-o', '--output', help='Write the results as JSON Lines plus a final JSON array file instead of printing them')
+    parser.add_argument('--journal', help='Run journal (JSON Lines); finished cells are skipped when the run is restarted with the same file')
+    args = parser.parse_args()
+    if args.output and os.path.splitext(args.output)[1] == '.jsonl':
+        parser.error('-o names the final JSON file, the .jsonl records are written next to it; use a .json name')
+    config_paths = args.config or [DEFAULT_CONFIG_PATH]
+
+    cache = None
+    if not args.no_cache:
+        cache = ResponseCache(args.cache_dir, max_bytes=args.cache_size * 1024 * 1024, refresh=args.refresh)
+
+    journal = JobJournal(args.journal) if args.journal else None
+    try:
+        if args.sweep:
+            models = load_models(config_paths)
+            if not models:
+                print("Error: no models found in the config.")
+                return
+            ram_budget = args.ram_budget * 1024 ** 3 if args.ram_budget else None
+            written = run_sweep(models, args.prompt_files, args.output_dir, max_per_model=args.max_per_model, stream=args.stream, cache=cache,
+                                journal=journal, context_root=args.context_root, ram_budget=ram_budget, keep_alive=args.keep_alive)
+            for file_path in written:
+                print(file_path)
+            return
+
+        config_data = read_config(config_paths[0])
+        if not config_data:
+            return
 
-    # Process each prompt file
-    process_multiple_prompts(prompt_files)
+        # Process each prompt file
+        process_multiple_prompts(args.prompt_files, config_data, max_per_model=args.max_per_model, stream=args.stream, cache=cache, journal=journal, context_root=args.context_root, output_path=args.output)
+    finally:
+        if journal is not None:
+            journal.close()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,78 @@
+import os
+import re
+
+# Words and single symbols, long identifiers count as several tokens
+TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+ATTACHMENT_PATTERN = re.compile(r"@([\w./-]+\.\w+)")
+
+# Tokens the chat template adds around each message
+MESSAGE_OVERHEAD = 4
+DEFAULT_OUTPUT_TOKENS = 150
+
+# Function to estimate the token count of a text without loading a tokenizer
+def estimate_tokens(text):
+    return sum(1 + len(token) // 5 for token in TOKEN_PATTERN.findall(text))
+
+# Function to find the @file references of a user message that exist under root
+def find_attachments(user_message, root='.'):
+    attachments = []
+    for name in ATTACHMENT_PATTERN.findall(user_message):
+        path = os.path.join(root, name)
+        if os.path.isfile(path):
+            with open(path, 'r', encoding='utf-8', errors='replace') as file:
+                attachments.append((name, file.read()))
+    return attachments
+
+# Function to cut a file down to the lines that fit in the token budget
+def trim_to_budget(text, budget):
+    kept = []
+    used = 0
+    lines = text.splitlines()
+    for line in lines:
+        line_tokens = estimate_tokens(line) + 1
+        if used + line_tokens > budget:
+            break
+        kept.append(line)
+        used += line_tokens
+    if len(kept) < len(lines):
+        kept.append(f"# ... {len(lines) - len(kept)} more lines trimmed to fit the context window")
+    return '\n'.join(kept)
+
+# Function to inline the attached files into the user message within the model's context length
+def pack_user_message(user_message, system_message, context_length, max_tokens=-1, root='.'):
+    output_tokens = max_tokens if max_tokens != -1 else DEFAULT_OUTPUT_TOKENS
+    system_tokens = estimate_tokens(system_message) + MESSAGE_OVERHEAD
+    user_tokens = estimate_tokens(user_message) + MESSAGE_OVERHEAD
+    report = {
+        'context_length': context_length,
+        'output_tokens': output_tokens,
+        'system_tokens': system_tokens,
+        'user_tokens': user_tokens,
+        'attachment_tokens': 0,
+        'trimmed': [],
+    }
+
+    attachments = find_attachments(user_message, root)
+    remaining = None
+    if context_length:
+        remaining = context_length - output_tokens - system_tokens - user_tokens
+
+    blocks = []
+    for index, (name, content) in enumerate(attachments):
+        fence_tokens = estimate_tokens(name) + 4
+        content_tokens = estimate_tokens(content)
+        if remaining is not None:
+            # Split what is left evenly over the attachments not placed yet
+            share = remaining // (len(attachments) - index) - fence_tokens
+            if content_tokens > share:
+                content = trim_to_budget(content, max(share, 0))
+                content_tokens = estimate_tokens(content)
+                report['trimmed'].append(name)
+            remaining -= content_tokens + fence_tokens
+        report['attachment_tokens'] += content_tokens + fence_tokens
+        blocks.append(f"```{name}\n{content}\n```")
+
+    report['total_tokens'] = system_tokens + user_tokens + report['attachment_tokens'] + output_tokens
+    if not blocks:
+        return user_message, report
+    return '\n\n'.join(blocks + [user_message]), report
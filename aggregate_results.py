@@ -0,0 +1,182 @@
+import argparse
+import json
+import math
+import os
+import re
+
+from score_answers import SCORED_PROMPTS
+
+WEB_SRC = os.path.join('code-assist-webUI', 'code-assist-web', 'src')
+PROMPT_NUMBERING = re.compile(r'^\s*(?:\d+|[IVXLC]+)\s*[.)]\s*')
+# Bumped when the cached records change shape, so an older state file is rebuilt
+STATE_VERSION = 2
+
+
+# Function to compute a nearest-rank percentile of a list of numbers
+def percentile(values, q):
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[max(1, math.ceil(q / 100 * len(ordered))) - 1]
+
+# Function to turn a user message into a short prompt key shared across runs ("1.Write ..." and "I.Write ..." match)
+def prompt_key(user_message):
+    text = (user_message or '').replace('<user>', '').replace('</user>', '')
+    # Pasted code starts with a fence, the first real line names the file instead
+    lines = [line.strip() for line in text.splitlines() if line.strip() and not line.strip().startswith('```')]
+    first_line = PROMPT_NUMBERING.sub('', lines[0]) if lines else ''
+    return ' '.join(first_line.split())[:80]
+
+# Function to name the "<Method> (prompt-results)" row score_answers.py writes for a user message, if it scores it
+def scored_method(user_message):
+    for method, pattern, _, _ in SCORED_PROMPTS:
+        if pattern.search(user_message or ''):
+            return method
+    return None
+
+# Function to reduce one run file to small (model, prompt, scored method, answer length, wall time) records
+def read_run_records(path):
+    with open(path, 'r', encoding='utf-8') as file:
+        data = json.load(file)
+
+    records = []
+    for entries in data.values():
+        for entry in entries:
+            model = entry.get('name') or os.path.basename(os.path.dirname(path))
+            for item in entry.get('prompt', []):
+                metrics = item.get('metrics') or {}
+                user_message = item.get('user')
+                records.append([model, prompt_key(user_message), scored_method(user_message), len(item.get('assistant') or ''), metrics.get('wall_time')])
+    return records
+
+# Function to refresh the per-file records, reading only the run files that changed since the last call
+def update_state(results_dir, state):
+    files = state.setdefault('files', {})
+    seen = set()
+    changed = 0
+    for model_dir in sorted(os.listdir(results_dir)):
+        model_path = os.path.join(results_dir, model_dir)
+        if not os.path.isdir(model_path):
+            continue
+        for name in sorted(os.listdir(model_path)):
+            if not name.endswith('.json'):
+                continue
+            path = os.path.join(model_path, name)
+            key = os.path.relpath(path, results_dir)
+            seen.add(key)
+            stat = os.stat(path)
+            cached = files.get(key)
+            if cached and cached['mtime'] == stat.st_mtime and cached['size'] == stat.st_size:
+                continue
+            try:
+                records = read_run_records(path)
+            except (ValueError, OSError, AttributeError) as e:
+                print(f"Error: skipping {path}: {e}")
+                records = []
+            files[key] = {'mtime': stat.st_mtime, 'size': stat.st_size, 'records': records}
+            changed += 1
+
+    for key in set(files) - seen:
+        del files[key]
+        changed += 1
+    return changed
+
+# Function to read the (passed, evaluated) counts of the prompt-results rows score_answers.py wrote per model and method
+def read_pass_rates(data_path):
+    if not os.path.exists(data_path):
+        return {}
+    with open(data_path, 'r', encoding='utf-8') as file:
+        data = json.load(file)
+
+    # The other rows score unrelated benchmarks (HumanEvalFix, MultiPL-E, ...) and are left out
+    scored_methods = {method for method, _, _, _ in SCORED_PROMPTS}
+    pass_rates = {}
+    for entry in data.get("0", []):
+        for row in entry.get("Data", []):
+            if row.get("Method") not in scored_methods:
+                continue
+            try:
+                total = int(row["Number of Problems Evaluated"])
+                passed = round(float(row["Pass@1"]) * total)
+            except (KeyError, TypeError, ValueError):
+                continue
+            pass_rates.setdefault(entry.get("Name"), {})[row["Method"]] = (passed, total)
+    return pass_rates
+
+# Function to format a pass rate from (passed, evaluated) counts
+def format_pass_rate(counts):
+    passed = sum(count[0] for count in counts)
+    total = sum(count[1] for count in counts)
+    return f"{passed / total:.3f}" if total else "Not applicable"
+
+# Function to build the compact dashboard summary from the per-file records
+def build_summary(state, pass_rates):
+    models = {}
+    run_counts = {}
+    for key, cached in state['files'].items():
+        for model, prompt, method, length, wall_time in cached['records']:
+            prompts = models.setdefault(model, {})
+            stats = prompts.setdefault(prompt, {'count': 0, 'method': method, 'lengths': [], 'latencies': []})
+            stats['count'] += 1
+            stats['method'] = stats['method'] or method
+            stats['lengths'].append(length)
+            if wall_time is not None:
+                stats['latencies'].append(wall_time)
+        for model in {record[0] for record in cached['records']}:
+            run_counts[model] = run_counts.get(model, 0) + 1
+
+    summary = []
+    for model in sorted(models):
+        model_rates = pass_rates.get(model, {})
+        rows = []
+        for prompt, stats in sorted(models[model].items()):
+            method_counts = [model_rates[stats['method']]] if stats['method'] in model_rates else []
+            rows.append({
+                "Method": prompt,
+                "Number of Problems Evaluated": stats['count'],
+                "Pass@1": format_pass_rate(method_counts),
+                "Average Answer Length": round(sum(stats['lengths']) / stats['count']),
+                "Latency p50": percentile(stats['latencies'], 50),
+                "Latency p95": percentile(stats['latencies'], 95),
+            })
+        summary.append({
+            "Name": model,
+            "Runs": run_counts.get(model, 0),
+            "Answers": sum(row["Number of Problems Evaluated"] for row in rows),
+            # Pooled over the scored prompt-results answers only
+            "Pass@1": format_pass_rate(model_rates.values()),
+            "Data": rows,
+        })
+    return {"0": summary}
+
+# Function to write a JSON file atomically
+def write_json(path, data, indent=None):
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as file:
+        json.dump(data, file, indent=indent, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+def main():
+    parser = argparse.ArgumentParser(description='Precompute the dashboard summary of all prompt-results runs.')
+    parser.add_argument('--results-dir', default=os.path.join(WEB_SRC, 'prompt-results'), help='prompt-results/<model>/*.json tree')
+    parser.add_argument('--data', default=os.path.join(WEB_SRC, 'code-assist-data.json'), help='Pass@1 scores per model and method')
+    parser.add_argument('--output', default=os.path.join(WEB_SRC, 'code-assist-summary.json'), help='Summary file served to the dashboard')
+    parser.add_argument('--state', help='Incremental state file (default: .<output name>.state next to the output)')
+    args = parser.parse_args()
+
+    state_path = args.state or os.path.join(os.path.dirname(args.output), '.' + os.path.basename(args.output) + '.state')
+    state = {}
+    if os.path.exists(state_path):
+        with open(state_path, 'r', encoding='utf-8') as file:
+            state = json.load(file)
+    if state.get('version') != STATE_VERSION:
+        state = {'version': STATE_VERSION}
+
+    changed = update_state(args.results_dir, state)
+    summary = build_summary(state, read_pass_rates(args.data))
+    write_json(state_path, state)
+    write_json(args.output, summary, indent=4)
+    print(f"{changed} run files changed, summary of {len(summary['0'])} models written to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -131,4 +131,18 @@ app.get("/api/code-assist", (req, res) => {
         if (err) return res.status(500).json({ error: "Failed to read code assist data" });
         res.json(JSON.parse(data));
     });
-});
\ No newline at end of file
+});
+
+// ✅ API to get the precomputed dashboard summary (built by aggregate_results.py)
+app.get("/api/code-assist/summary", (req, res) => {
+    const filePath = path.join(__dirname, "src", "code-assist-summary.json");
+
+    if (!fs.existsSync(filePath)) {
+        return res.status(404).json({ error: "Code assist summary not found" });
+    }
+
+    fs.readFile(filePath, "utf8", (err, data) => {
+        if (err) return res.status(500).json({ error: "Failed to read code assist summary" });
+        res.json(JSON.parse(data));
+    });
+});
@@ -16,6 +16,8 @@ const ModelComparison = () => {
     const [apiError, setApiError] = useState<string | null>(null); // State to handle API errors
     const [availableFiles, setAvailableFiles] = useState<string[]>([]); // State to store available files
     const [allFileNames, setAllFileNames] = useState<string[]>([]);
+    const [summaryModels, setSummaryModels] = useState<string[]>([]); // Model names from the precomputed summary
+    const [modelFiles, setModelFiles] = useState<{ [folder: string]: string[] }>({}); // Run file names per model folder
     const [noResultsFound, setNoResultsFound] = useState<boolean>(false); // State to indicate no results found
     const [serverIP, setServerIP] = useState("localhost");
     const [serverPort, setServerPort] = useState<number>(5005); // Default to 5001
@@ -86,77 +88,87 @@ const ModelComparison = () => {
     }, [serverIP, serverPort]);
 
 
-    // Fetch models data when compare option changes or date changes
+    // Fetch the model list from the precomputed summary instead of reading every run file
     useEffect(() => {
-        const fetchModelData = async () => {
-            setIsLoading(true);
-            setApiError(null);
-            setNoResultsFound(false);
+        const fetchSummary = async () => {
             try {
-                const responses = await Promise.all(
-                    availableFiles.map(async file => {
-                        const date = selectedDates[file] || null;
-                        let fileNames = await fetch(`http://${serverIP}:${serverPort}/api/models/${file}/files`).then(r => r.json());
-                        fileNames = fileNames.flat();
-
-                        // setAllFileNames(fileNames);
-                        // console.log("fileNames::>", allFileNames);
-                        
+                const response = await fetch(`http://${serverIP}:${serverPort}/api/code-assist/summary`);
+                if (!response.ok) throw new Error("Failed to fetch summary");
+                const summary = await response.json();
+                setSummaryModels(Object.values(summary).flat().map((model: any) => model.Name));
+            } catch (error) {
+                console.error("Error fetching summary:", error);
+                setApiError("Failed to fetch models. Please try again later.");
+            }
+        };
 
-                        const fileResponses: any[] = await Promise.all(
-                            fileNames.map(async (fileName: string) => {
-                                return fetch(`http://${serverIP}:${serverPort}/api/models/${file}/files/${fileName}`)
-                                    .then((r: Response) => r.json());
-                            })
-                        );
-
-                        setAllFileNames(prev =>
-                            [...prev, ...fileNames].reduce((acc, fileName) => 
-                              acc.includes(fileName) ? acc : [...acc, fileName], [])
-                          );
-                        console.log("fileNames::>>", allFileNames);
-
-                        return fileResponses.flat();
-                    })
-                );
+        fetchSummary();
+    }, [serverIP, serverPort]);
 
-                // Normalize response structure
-                const allModels = responses.flatMap(response => 
-                    Object.values(response).flat()
+    // Fetch only the file names of each model folder, the run files themselves are loaded on demand
+    useEffect(() => {
+        const fetchFileLists = async () => {
+            try {
+                const fileLists: string[][] = await Promise.all(
+                    availableFiles.map(file =>
+                        fetch(`http://${serverIP}:${serverPort}/api/models/${file}/files`).then(r => r.json())
+                    )
                 );
-
-                console.log("Normalized Models:", allModels);
-                setModelsData(allModels);
+                const files: { [folder: string]: string[] } = {};
+                availableFiles.forEach((file, index) => { files[file] = fileLists[index]; });
+                setModelFiles(files);
+                setAllFileNames(Array.from(new Set(fileLists.flat())));
             } catch (error) {
-                console.error("Error fetching models:", error);
-                setApiError("Failed to fetch models. Please try again later.");
-            } finally {
-                setIsLoading(false);
+                console.error("Error fetching files:", error);
+                setApiError("Failed to fetch available files. Please try again later.");
             }
         };
 
         if (availableFiles.length > 0) {
-            fetchModelData();
+            fetchFileLists();
         }
-    }, [availableFiles, serverIP, serverPort, selectedDates]);
-
-
+    }, [availableFiles, serverIP, serverPort]);
 
     // Prepare model lists
     const flattenedModels = modelsData.flatMap(item => Object.values(item).flat());
 
-    const graniteModels = Array.from(new Set(
-        flattenedModels
-            .filter(model => model.name && model.name.toLowerCase().includes("granite"))
-            .map(model => model.name)
-    ));
+    // Fetch the selected (or latest) run file of the two compared models only
+    useEffect(() => {
+        const fetchComparedRuns = async () => {
+            const wanted = [selectedGranite, selectedOther]
+                .filter((name): name is string => !!name)
+                .map(name => {
+                    const latest = [...(modelFiles[name.replace(/\//g, '_')] || [])].sort().pop();
+                    const fileName = selectedResults[name] || latest;
+                    const folder = Object.keys(modelFiles).find(key => fileName && modelFiles[key].includes(fileName));
+                    return { folder, fileName };
+                })
+                .filter(run => run.folder && !flattenedModels.some(model => model.file_name === run.fileName));
+            if (wanted.length === 0) return;
+
+            setIsLoading(true);
+            setApiError(null);
+            try {
+                const runs = await Promise.all(
+                    wanted.map(({ folder, fileName }) =>
+                        fetch(`http://${serverIP}:${serverPort}/api/models/${folder}/files/${fileName}`).then(r => r.json())
+                    )
+                );
+                setModelsData(prev => [...prev, ...runs]);
+            } catch (error) {
+                console.error("Error fetching models:", error);
+                setApiError("Failed to fetch models. Please try again later.");
+            } finally {
+                setIsLoading(false);
+            }
+        };
+
+        fetchComparedRuns();
+    }, [selectedGranite, selectedOther, selectedResults, modelFiles, serverIP, serverPort]);
 
+    const graniteModels = summaryModels.filter(name => name.toLowerCase().includes("granite"));
 
-    const otherModels = Array.from(new Set(
-        flattenedModels
-            .filter(model => model.name && !model.name.toLowerCase().includes("granite"))
-            .map(model => model.name)
-    ));
+    const otherModels = summaryModels.filter(name => !name.toLowerCase().includes("granite"));
 
     console.log("Granite Models:", graniteModels);
     console.log("Other Models:", otherModels);
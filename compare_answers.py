@@ -0,0 +1,235 @@
+import argparse
+import difflib
+import hashlib
+import json
+import os
+import re
+from itertools import combinations
+
+from result_index import CHAT_RESULTS_DIR, SKIPPED_NAMES, parse_chat_transcript, parse_result_json
+
+PROMPT_RESULTS_DIR = os.path.join('code-assist-webUI', 'code-assist-web', 'src', 'prompt-results')
+TOKEN = re.compile(r'\w+|[^\w\s]')
+
+
+# Function to normalise a question so the same prompt matches across executions ("...python?" and "...python")
+def prompt_key(question):
+    text = (question or '').replace('<user>', '').replace('</user>', '')
+    return ' '.join(text.lower().split()).rstrip(' .?!')
+
+# Function to read every (model, run, prompt, answer) of the chat-results transcripts
+def collect_chat_answers(chat_dir):
+    answers = []
+    for model_dir in sorted(os.listdir(chat_dir)):
+        model_path = os.path.join(chat_dir, model_dir)
+        if model_dir in SKIPPED_NAMES or not os.path.isdir(model_path):
+            continue
+        model = model_dir[len('chat_'):] if model_dir.startswith('chat_') else model_dir
+        for run in sorted(os.listdir(model_path)):
+            run_path = os.path.join(model_path, run)
+            if run in SKIPPED_NAMES or not os.path.isfile(run_path) or run.endswith('.png'):
+                continue
+            for question, answer in parse_chat_transcript(run_path):
+                answers.append((model, run.lower(), prompt_key(question), answer))
+    return answers
+
+# Function to read every (model, run, prompt, answer) of the prompt-results JSON runs
+def collect_json_answers(results_dir):
+    answers = []
+    for model_dir in sorted(os.listdir(results_dir)):
+        model_path = os.path.join(results_dir, model_dir)
+        if not os.path.isdir(model_path):
+            continue
+        for name in sorted(os.listdir(model_path)):
+            if not name.endswith('.json'):
+                continue
+            try:
+                runs = parse_result_json(os.path.join(model_path, name))
+            except (ValueError, OSError) as e:
+                print(f"Error: skipping {name}: {e}")
+                continue
+            for model, _, _, pairs in runs:
+                for question, answer in pairs:
+                    answers.append((model or model_dir, name, prompt_key(question), answer or ''))
+    return answers
+
+# Function to split an answer into overlapping word shingles
+def shingles(text, size=5):
+    tokens = TOKEN.findall(text.lower())
+    if len(tokens) <= size:
+        return {tuple(tokens)} if tokens else set()
+    return {tuple(tokens[i:i + size]) for i in range(len(tokens) - size + 1)}
+
+# Function to hash a shingle to 64 bits, the same in every process (hash() is salted per process)
+def shingle_hash(shingle):
+    return int.from_bytes(hashlib.blake2b(' '.join(shingle).encode('utf-8'), digest_size=8).digest(), 'little')
+
+# Function to build a MinHash signature with one hash per shingle (one-permutation hashing)
+def minhash(shingle_set, num_bins=128):
+    if not shingle_set:
+        return None
+    bins = [None] * num_bins
+    for shingle in shingle_set:
+        value = shingle_hash(shingle)
+        index = value % num_bins
+        value //= num_bins
+        if bins[index] is None or value < bins[index]:
+            bins[index] = value
+
+    # Densify: an empty bin borrows the next filled bin, offset by the distance so borrowed values stay distinct
+    filled = [i for i, value in enumerate(bins) if value is not None]
+    for i in range(num_bins):
+        if bins[i] is None:
+            distance = next(((j - i) % num_bins for j in filled if j > i), filled[0] + num_bins - i)
+            bins[i] = ('borrowed', distance, bins[(i + distance) % num_bins])
+    return bins
+
+# Function to estimate the Jaccard similarity of two signatures
+def estimate_similarity(first, second):
+    return sum(a == b for a, b in zip(first, second)) / len(first)
+
+# Function to find the candidate pairs that share at least one LSH band within the same prompt
+def candidate_pairs(signatures, bands=32):
+    rows = len(next(iter(signatures.values()))[1]) // bands
+    buckets = {}
+    for item, (prompt, signature) in signatures.items():
+        for band in range(bands):
+            key = (prompt, band, tuple(signature[band * rows:(band + 1) * rows]))
+            buckets.setdefault(key, []).append(item)
+
+    pairs = set()
+    for items in buckets.values():
+        pairs.update(combinations(items, 2))
+    return pairs
+
+# Function to compare two answers line by line
+def line_similarity(first, second):
+    if first == second:
+        return 1.0
+    return difflib.SequenceMatcher(None, first.splitlines(), second.splitlines(), autojunk=False).ratio()
+
+# Function to compute the per-model consistency and the cross-model agreement of every prompt
+def compare(answers, shingle_size=5, num_bins=128, bands=32, threshold=0.5, min_estimate=0.3):
+    signatures = {}
+    for item, (model, run, prompt, answer) in enumerate(answers):
+        signature = minhash(shingles(answer, shingle_size), num_bins)
+        if prompt and signature is not None:
+            signatures[item] = (prompt, signature)
+    if not signatures:
+        return {'models': {}, 'prompts': {}, 'duplicates': [], 'answers': 0, 'candidates': 0, 'diffed': 0}
+
+    # Only LSH candidates whose signatures really agree get the line diff; other pairs use the MinHash estimate
+    candidates = candidate_pairs(signatures, bands)
+    diffed = {}
+    for first, second in candidates:
+        if estimate_similarity(signatures[first][1], signatures[second][1]) >= min_estimate:
+            diffed[(first, second)] = line_similarity(answers[first][3], answers[second][3])
+
+    groups = {}
+    for item, (prompt, _) in signatures.items():
+        groups.setdefault((answers[item][0], prompt), []).append(item)
+
+    # Consistency: a model against its own other runs of the same prompt (a handful of answers per group)
+    models = {}
+    for (model, prompt), items in groups.items():
+        scores = []
+        for pair in combinations(items, 2):
+            if pair in diffed:
+                scores.append(diffed[pair])
+            else:
+                scores.append(estimate_similarity(signatures[pair[0]][1], signatures[pair[1]][1]))
+        if scores:
+            models.setdefault(model, {})[prompt] = round(sum(scores) / len(scores), 3)
+
+    # Agreement: the share of cross-model pairs of a prompt that are near-duplicates, counted without enumerating them
+    per_prompt = {}
+    for (model, prompt), items in groups.items():
+        per_prompt.setdefault(prompt, []).append(len(items))
+    near_duplicates = {}
+    duplicates = []
+    for (first, second), similarity in diffed.items():
+        if similarity < threshold:
+            continue
+        prompt = signatures[first][0]
+        if answers[first][0] != answers[second][0]:
+            near_duplicates[prompt] = near_duplicates.get(prompt, 0) + 1
+        duplicates.append({
+            'prompt': prompt,
+            'first': f"{answers[first][0]}/{answers[first][1]}",
+            'second': f"{answers[second][0]}/{answers[second][1]}",
+            'similarity': round(similarity, 3),
+        })
+
+    prompts = {}
+    for prompt, counts in per_prompt.items():
+        total = sum(counts)
+        cross_pairs = (total * total - sum(count * count for count in counts)) // 2
+        prompts[prompt] = {
+            'answers': total,
+            'models': len(counts),
+            'agreement': round(near_duplicates.get(prompt, 0) / cross_pairs, 3) if cross_pairs else None,
+        }
+
+    duplicates.sort(key=lambda row: (row['prompt'], -row['similarity']))
+    return {
+        'models': {model: {'consistency': round(sum(scores.values()) / len(scores), 3), 'prompts': scores}
+                   for model, scores in sorted(models.items())},
+        'prompts': dict(sorted(prompts.items())),
+        'duplicates': duplicates,
+        'answers': len(signatures),
+        'candidates': len(candidates),
+        'diffed': len(diffed),
+    }
+
+# Function to print the unified diff of one model's answers to a prompt in two runs
+def print_diff(answers, model, prompt, first_run, second_run):
+    texts = {run: answer for answer_model, run, answer_prompt, answer in answers
+             if answer_model == model and answer_prompt == prompt_key(prompt)}
+    if first_run not in texts or second_run not in texts:
+        print(f"No answers of {model} to '{prompt}' in both {first_run} and {second_run}. Runs: {', '.join(sorted(texts))}")
+        return
+    diff = difflib.unified_diff(texts[first_run].splitlines(), texts[second_run].splitlines(), first_run, second_run, lineterm='')
+    print('\n'.join(diff))
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure how stable model answers are across executions and models.')
+    parser.add_argument('--chat-dir', default=CHAT_RESULTS_DIR, help='chat-results/<model>/<execution> transcripts')
+    parser.add_argument('--results-dir', help='Also compare prompt-results/<model>/*.json runs (e.g. ' + PROMPT_RESULTS_DIR + ')')
+    parser.add_argument('--shingle-size', type=int, default=5, help='Words per shingle')
+    parser.add_argument('--num-bins', type=int, default=128, help='MinHash signature length')
+    parser.add_argument('--bands', type=int, default=32, help='LSH bands, more bands find less similar candidates')
+    parser.add_argument('--threshold', type=float, default=0.5, help='Line similarity at which two answers count as near-duplicates')
+    parser.add_argument('--min-estimate', type=float, default=0.3, help='Estimated similarity a candidate pair needs to be diffed')
+    parser.add_argument('--diff', nargs=4, metavar=('MODEL', 'PROMPT', 'RUN1', 'RUN2'), help='Print the line diff of two runs instead')
+    parser.add_argument('-o', '--output', help='Write the full report as JSON')
+    args = parser.parse_args()
+
+    if args.num_bins % args.bands:
+        parser.error('--num-bins must be a multiple of --bands')
+
+    answers = collect_chat_answers(args.chat_dir) if os.path.isdir(args.chat_dir) else []
+    if args.results_dir:
+        answers += collect_json_answers(args.results_dir)
+
+    if args.diff:
+        print_diff(answers, *args.diff)
+        return
+
+    report = compare(answers, args.shingle_size, args.num_bins, args.bands, args.threshold, args.min_estimate)
+    total_pairs = report['answers'] * (report['answers'] - 1) // 2
+    print(f"{report['answers']} answers, {report['diffed']} of {total_pairs} pairs diffed")
+    print("\nConsistency across executions (1.0 = identical answers):")
+    for model, stats in report['models'].items():
+        print(f"  {model}: {stats['consistency']:.3f}")
+    print("\nCross-model agreement (share of near-duplicate answer pairs):")
+    for prompt, stats in report['prompts'].items():
+        agreement = 'n/a' if stats['agreement'] is None else f"{stats['agreement']:.3f}"
+        print(f"  {prompt[:70]}: {agreement} ({stats['answers']} answers, {stats['models']} models)")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=4, ensure_ascii=False)
+        print(f"\nReport written to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -1,104 +1,123 @@
+import argparse
+import glob
 import json
 import re
 import os
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
 
-def clean_content(content):
-    # Remove ">" symbols from the start of each line in the content
-    lines = content.split('\n')
-    cleaned_lines = [re.sub(r'^>+\s*', '', line) for line in lines]
-    return '\n'.join(cleaned_lines)
+# Precompiled patterns for the quote prefix and the role headers of a session transcript
+QUOTE_PREFIX = re.compile(r'^>+\s*')
+ROLE_HEADER = re.compile(r'^#### _(User|Assistant)_\s*$')
+
+def iter_session_pairs(filename):
+    # Read the transcript line by line and yield each {user, assistant} pair as soon as it closes,
+    # so only the current turn is held in memory
+    user_content = None
+    current_role = None
+    current_content = []
+    first_assistant_block_skipped = False
+
+    with open(filename, 'r', encoding='utf-8') as file:
+        for line in file:
+            # Remove both single and double ">" symbols and leading/trailing whitespace
+            line = QUOTE_PREFIX.sub('', line).rstrip()
+
+            # Skip empty lines
+            if not line:
+                continue
+
+            header = ROLE_HEADER.match(line)
+            if header:
+                # Close the previous block
+                if current_content and current_role:
+                    content = '\n'.join(current_content)
+                    if content and content.strip().lower() != "/share":
+                        if current_role == "User":
+                            user_content = content
+                        elif not first_assistant_block_skipped:
+                            # The first assistant block is Continue's system prompt
+                            first_assistant_block_skipped = True
+                        elif user_content is not None:
+                            yield {"user": user_content, "assistant": content}
+                            user_content = None
+
+                # Set new role
+                current_role = header.group(1)
+                current_content = []
+            elif line.strip().lower() != "/share":
+                # Append content to current message, removing nested quote markers as well
+                current_content.append(QUOTE_PREFIX.sub('', line))
+
+    # Handle the last message
+    if current_content and current_role == "Assistant" and user_content is not None:
+        content = '\n'.join(current_content)
+        if content and content.strip().lower() != "/share":
+            yield {"user": user_content, "assistant": content}
 
 def parse_md_to_json(filename):
-    conversation = {
+    return {
         "0": [
             {
                 "name": "ENTER MODEL NAME HERE",
                 "desc": "ENTER OTHER DETAILS HERE",
-                "prompt": []
+                "prompt": list(iter_session_pairs(filename))
             }
         ]
     }
-    
-    user_content = None
-    assistant_content = None
-    current_role = None
-    current_content = []
-    first_assistant_block_skipped = False
-    
-    with open(filename, 'r', encoding='utf-8') as file:
-        lines = file.readlines()
-    
-    for line in lines:
-        # Remove both single and double ">" symbols and leading/trailing whitespace
-        line = re.sub(r'^>+\s*', '', line).rstrip()
-        
-        # Check for role headers
-        assistant_match = re.match(r'^#### _Assistant_\s*$', line)
-        user_match = re.match(r'^#### _User_\s*$', line)
-        
-        # Skip empty lines
-        if not line:
-            continue
-            
-        if assistant_match or user_match:
-            # Save previous content
-            if current_content and current_role:
-                content = '\n'.join(line for line in current_content if line.strip())
-                content = clean_content(content)
-                
-                if content and not content.strip().lower() == "/share":
-                    if current_role == "User":
-                        # If we have previous pair, save it first
-                        if user_content is not None and assistant_content is not None:
-                            conversation["0"][0]["prompt"].append({
-                                "user": user_content,
-                                "assistant": assistant_content
-                            })
-                        user_content = content
-                        assistant_content = None
-                    elif current_role == "Assistant" and not first_assistant_block_skipped:
-                        first_assistant_block_skipped = True
-                    elif current_role == "Assistant" and user_content is not None:
-                        assistant_content = content
-                        conversation["0"][0]["prompt"].append({
-                            "user": user_content,
-                            "assistant": assistant_content
-                        })
-                        user_content = None
-                        assistant_content = None
-            
-            # Set new role
-            current_role = "Assistant" if assistant_match else "User"
-            current_content = []
-                
+
+# Function to work out the JSON file name for a session markdown file
+def output_path_for(input_path, output_dir=None):
+    base_name = os.path.splitext(os.path.basename(input_path))[0] + '.json'
+    return os.path.join(output_dir or os.path.dirname(input_path), base_name)
+
+# Function to convert one session file, skipping it when its JSON is newer than the markdown
+def convert_file(input_path, output_dir=None, force=False):
+    output_file = output_path_for(input_path, output_dir)
+    if not force and os.path.exists(output_file) and os.path.getmtime(output_file) >= os.path.getmtime(input_path):
+        return input_path, output_file, False
+
+    result = parse_md_to_json(input_path)
+
+    # Save to JSON file next to the input (or in the output directory)
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(result, f, indent=2, ensure_ascii=False)
+    return input_path, output_file, True
+
+# Function to expand directories and glob patterns into the list of markdown files
+def collect_inputs(paths):
+    inputs = []
+    for path in paths:
+        if os.path.isdir(path):
+            inputs.extend(sorted(glob.glob(os.path.join(path, '*.md'))))
         else:
-            # Skip the "/share" message
-            if line.strip().lower() == "/share":
+            inputs.extend(sorted(glob.glob(path)))
+    return inputs
+
+def main():
+    parser = argparse.ArgumentParser(description='Convert Continue session markdown files to JSON.')
+    parser.add_argument('paths', nargs='*', default=['outputfiles'], help='Markdown files, directories or glob patterns')
+    parser.add_argument('-o', '--output-dir', help='Directory for the JSON files (default: next to each input)')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count(), help='Number of worker processes')
+    parser.add_argument('-f', '--force', action='store_true', help='Convert even when the JSON file is up to date')
+    args = parser.parse_args()
+
+    inputs = collect_inputs(args.paths)
+    if not inputs:
+        print("No markdown files found.")
+        return
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+
+    with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        futures = [executor.submit(convert_file, path, args.output_dir, args.force) for path in inputs]
+        for future in futures:
+            try:
+                input_path, output_file, converted = future.result()
+            except (OSError, UnicodeDecodeError) as e:
+                print(f"Error: {e}")
                 continue
-            # Append content to current message
-            current_content.append(line)
-    
-    # Handle the last message
-    if current_content and current_role:
-        content = '\n'.join(line for line in current_content if line.strip())
-        content = clean_content(content)
-        if content and not content.strip().lower() == "/share":
-            if current_role == "Assistant" and user_content is not None:
-                conversation["0"][0]["prompt"].append({
-                    "user": user_content,
-                    "assistant": content
-                })
-    
-    return conversation
-
-# Use the function with correct path
-input_filename = '20250307T130350_session.md'
-file = os.path.join('outputfiles', input_filename )
-result = parse_md_to_json(file)
-
-# Save to JSON file in outputfiles directory
-output_filename = input_filename.join('.json')
-output_file = os.path.join('outputfiles', output_filename)
-with open(output_file, 'w', encoding='utf-8') as f:
-    json.dump(result, f, indent=2, ensure_ascii=False)
\ No newline at end of file
+            status = "converted" if converted else "up to date"
+            print(f"{input_path} -> {output_file} ({status})")
+
+if __name__ == "__main__":
+    main()
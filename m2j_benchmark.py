@@ -0,0 +1,63 @@
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+from m2j import iter_session_pairs
+
+CODE_BLOCK = '''> ```python example.py
+> def binary_search(arr, target):
+>     low, high = 0, len(arr) - 1
+>     while low <= high:
+>         mid = (low + high) // 2
+>         if arr[mid] == target:
+>             return mid
+>         elif arr[mid] < target:
+>             low = mid + 1
+>         else:
+>             high = mid - 1
+>     return -1
+> ```
+'''
+
+# Function to write a synthetic Continue session with the given number of turns
+def write_synthetic_session(path, turns, code_blocks_per_answer):
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write("### [Continue](https://continue.dev) session transcript\n Exported: 07/03/2025, 12:03:50\n\n")
+        file.write("#### _Assistant_\n\n> Always include the language and file name in the info string.\n\n")
+        for turn in range(turns):
+            file.write(f"#### _User_\n\n> Question {turn}: write a binary search in Python.\n\n")
+            file.write("#### _Assistant_\n\n> Here is the implementation:\n> \n")
+            for _ in range(code_blocks_per_answer):
+                file.write(CODE_BLOCK)
+            file.write("> \n> This runs in O(log n) time.\n\n")
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure m2j parser throughput on a large synthetic session.')
+    parser.add_argument('--turns', type=int, default=2000, help='Number of user/assistant turns')
+    parser.add_argument('--code-blocks', type=int, default=20, help='Code blocks pasted into each answer')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'synthetic_session.md')
+        write_synthetic_session(path, args.turns, args.code_blocks)
+        size_mb = os.path.getsize(path) / (1024 * 1024)
+
+        # Time and memory are measured in separate passes, tracemalloc slows parsing down considerably
+        start = time.perf_counter()
+        pairs = sum(1 for _ in iter_session_pairs(path))
+        elapsed = time.perf_counter() - start
+
+        tracemalloc.start()
+        for _ in iter_session_pairs(path):
+            pass
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    print(f"Session size: {size_mb:.1f} MB, {pairs} pairs")
+    print(f"Parse time: {elapsed:.2f} s ({size_mb / elapsed:.1f} MB/s)")
+    print(f"Peak memory: {peak / 1024:.0f} KiB")
+
+if __name__ == "__main__":
+    main()
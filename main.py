@@ -1,5 +1,16 @@
+import argparse
+
 from tasks.manager import view_tasks, add_task, mark_task_completed, delete_task
-from tasks.file_io import save_tasks, load_tasks
+from tasks.storage import open_backend
+
+PAGE_SIZE = 20
+VIEW_FILTERS = {
+    "Pending": {"completed": False},
+    "Done": {"completed": True},
+    "Low": {"priority": "Low"},
+    "Medium": {"priority": "Medium"},
+    "High": {"priority": "High"},
+}
 
 def display_menu():
     print("\nTo-Do List Application")
@@ -12,12 +23,26 @@ def display_menu():
     print("7. Exit")
 
 def main():
-    tasks = load_tasks()
+    parser = argparse.ArgumentParser(description='To-Do List Application')
+    parser.add_argument('--storage', choices=['json', 'sqlite'], default='json', help='Where tasks are kept')
+    parser.add_argument('--db', default='tasks.sqlite', help='SQLite database shared by several sessions')
+    args = parser.parse_args()
+
+    storage = open_backend(args.storage, args.db)
+    tasks = storage.load()
     while True:
         display_menu()
         choice = input("Choose an option: ").strip()
         if choice == "1":
-            print(view_tasks(tasks))
+            show = input("Show (All, Pending, Done, Low, Medium, High): ").strip().capitalize()
+            filters = VIEW_FILTERS.get(show, {})
+            sort_by = "priority" if input("Sort by priority? (y/N): ").strip().lower() == "y" else None
+            page = 1
+            while True:
+                print(view_tasks(tasks, page=page, page_size=PAGE_SIZE, sort_by=sort_by, **filters))
+                if input("Press n for the next page, Enter to go back: ").strip().lower() != "n":
+                    break
+                page += 1
         elif choice == "2":
             name = input("Enter the task name: ").strip()
             priority = input("Enter priority (Low, Medium, High): ").strip().capitalize()
@@ -35,12 +60,13 @@ def main():
             except ValueError:
                 print("Invalid input. Enter a number.")
         elif choice == "5":
-            print(save_tasks(tasks))
+            print(storage.save(tasks))
         elif choice == "6":
-            tasks = load_tasks()
+            tasks = storage.load()
             print("Tasks loaded successfully!")
         elif choice == "7":
             print("Goodbye!")
+            storage.close()
             break
         else:
             print("Invalid choice. Please try again.")
@@ -0,0 +1,230 @@
+import argparse
+import json
+import os
+import re
+import sqlite3
+
+# Trees holding evaluation results, relative to the repository root
+CHAT_RESULTS_DIR = 'chat-results'
+JSON_RESULT_SOURCES = [
+    'outputfiles',
+    'prompt_result.json',
+    os.path.join('code-assist-webUI', 'code-assist-web', 'src', 'prompt-results'),
+    os.path.join('code-assist-webUI', 'code-assist-web', 'src', 'prompt_result.json'),
+]
+
+QUESTION_LINE = re.compile(r'^Question\s*\d+\s*:\s*(.*)$')
+RESPONSE_LINE = re.compile(r'^\s*respon[s]?e\s*:\s*$', re.IGNORECASE)
+SEPARATOR_LINE = re.compile(r'^\s*[-=]{5,}\s*$')
+SKIPPED_NAMES = {'.DS_Store', 'images'}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    mtime REAL NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS answers (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL,
+    source TEXT NOT NULL,
+    model TEXT,
+    run TEXT,
+    created_at TEXT,
+    prompt TEXT,
+    answer TEXT
+);
+CREATE INDEX IF NOT EXISTS answers_path ON answers (path);
+CREATE INDEX IF NOT EXISTS answers_model ON answers (model);
+CREATE VIRTUAL TABLE IF NOT EXISTS answers_fts USING fts5 (prompt, answer, content='answers', content_rowid='id');
+"""
+
+
+# Function to split a chat-results transcript into (question, answer) pairs
+def parse_chat_transcript(path):
+    pairs = []
+    question = None
+    answer_lines = []
+
+    def close():
+        if question is not None:
+            lines = [line for line in answer_lines if not SEPARATOR_LINE.match(line)]
+            pairs.append((question, '\n'.join(lines).strip()))
+
+    with open(path, 'r', encoding='utf-8', errors='replace') as file:
+        for line in file:
+            line = line.rstrip('\n')
+            match = QUESTION_LINE.match(line)
+            if match:
+                close()
+                question = match.group(1).strip()
+                answer_lines = []
+            elif question is not None:
+                # Drop the "Response:" label that precedes each answer
+                if RESPONSE_LINE.match(line) and not any(previous.strip() for previous in answer_lines):
+                    continue
+                answer_lines.append(line)
+    close()
+    return pairs
+
+# Function to read the {"0": [{"name", "prompt": [{user, assistant}]}]} result layout
+def parse_result_json(path):
+    with open(path, 'r', encoding='utf-8') as file:
+        data = json.load(file)
+
+    runs = []
+    for entries in data.values() if isinstance(data, dict) else []:
+        for entry in entries if isinstance(entries, list) else []:
+            if not isinstance(entry, dict):
+                continue
+            pairs = [(item.get('user'), item.get('assistant')) for item in entry.get('prompt', []) if isinstance(item, dict)]
+            runs.append((entry.get('name'), entry.get('file_name'), entry.get('created_at'), pairs))
+    return runs
+
+
+class ResultIndex:
+    def __init__(self, db_path='result-index.sqlite', root='.'):
+        """Open (or create) the SQLite index of the result trees under root."""
+        self.root = root
+        self.connection = sqlite3.connect(db_path)
+        self.connection.executescript(SCHEMA)
+
+    def close(self):
+        self.connection.close()
+
+    def _source_files(self):
+        """Yield (relative path, source kind) for every result file in the known trees."""
+        chat_dir = os.path.join(self.root, CHAT_RESULTS_DIR)
+        for dirpath, dirnames, filenames in os.walk(chat_dir):
+            dirnames[:] = [name for name in dirnames if name not in SKIPPED_NAMES]
+            for name in filenames:
+                if name in SKIPPED_NAMES or name.endswith('.png'):
+                    continue
+                yield os.path.relpath(os.path.join(dirpath, name), self.root), 'chat-results'
+
+        for source in JSON_RESULT_SOURCES:
+            source_path = os.path.join(self.root, source)
+            if os.path.isfile(source_path):
+                yield source, 'json'
+            for dirpath, _, filenames in os.walk(source_path):
+                for name in filenames:
+                    if name.endswith('.json'):
+                        yield os.path.relpath(os.path.join(dirpath, name), self.root), 'json'
+
+    def _parse(self, path, kind):
+        """Return the answer rows of one result file."""
+        full_path = os.path.join(self.root, path)
+        if kind == 'chat-results':
+            # chat-results/<model>/<execution>, the folder names carry a chat_ prefix
+            parts = path.split(os.sep)
+            model = parts[1][len('chat_'):] if parts[1].startswith('chat_') else parts[1]
+            run = '/'.join(parts[2:])
+            return [(model, run, None, prompt, answer) for prompt, answer in parse_chat_transcript(full_path)]
+
+        rows = []
+        for model, file_name, created_at, pairs in parse_result_json(full_path):
+            run = file_name or os.path.basename(path)
+            rows.extend((model, run, created_at, prompt, answer) for prompt, answer in pairs)
+        return rows
+
+    def _remove(self, path):
+        # External-content FTS rows are deleted by replaying their old values
+        self.connection.execute(
+            "INSERT INTO answers_fts (answers_fts, rowid, prompt, answer) "
+            "SELECT 'delete', id, prompt, answer FROM answers WHERE path = ?", (path,))
+        self.connection.execute("DELETE FROM answers WHERE path = ?", (path,))
+        self.connection.execute("DELETE FROM files WHERE path = ?", (path,))
+
+    def update(self):
+        """Re-index the files whose mtime or size changed and drop deleted ones."""
+        known = {path: (mtime, size) for path, mtime, size in self.connection.execute("SELECT path, mtime, size FROM files")}
+        seen = set()
+        stats = {'indexed': 0, 'unchanged': 0, 'removed': 0, 'failed': 0}
+
+        with self.connection:
+            for path, kind in self._source_files():
+                seen.add(path)
+                stat = os.stat(os.path.join(self.root, path))
+                if known.get(path) == (stat.st_mtime, stat.st_size):
+                    stats['unchanged'] += 1
+                    continue
+
+                self._remove(path)
+                try:
+                    rows = self._parse(path, kind)
+                except (ValueError, OSError) as e:
+                    print(f"Error: could not index {path}: {e}")
+                    rows = []
+                    stats['failed'] += 1
+                else:
+                    stats['indexed'] += 1
+
+                for model, run, created_at, prompt, answer in rows:
+                    cursor = self.connection.execute(
+                        "INSERT INTO answers (path, source, model, run, created_at, prompt, answer) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        (path, kind, model, run, created_at, prompt, answer))
+                    self.connection.execute(
+                        "INSERT INTO answers_fts (rowid, prompt, answer) VALUES (?, ?, ?)",
+                        (cursor.lastrowid, prompt, answer))
+                # Failed files are recorded too, so they are only retried once they change
+                self.connection.execute(
+                    "INSERT INTO files (path, mtime, size) VALUES (?, ?, ?)", (path, stat.st_mtime, stat.st_size))
+
+            for path in set(known) - seen:
+                self._remove(path)
+                stats['removed'] += 1
+        return stats
+
+    def search(self, query, column=None, model=None, limit=50, raw=False):
+        """Full-text search over prompts and answers; raw=True passes the query through as FTS5 syntax."""
+        if not raw:
+            query = quote_query(query)
+        match = f'{column} : ({query})' if column else query
+        sql = ("SELECT answers.model, answers.run, answers.path, answers.prompt, answers.answer "
+               "FROM answers_fts JOIN answers ON answers.id = answers_fts.rowid WHERE answers_fts MATCH ?")
+        params = [match]
+        if model:
+            sql += " AND answers.model = ?"
+            params.append(model)
+        sql += " ORDER BY rank LIMIT ?"
+        params.append(limit)
+        return self.connection.execute(sql, params).fetchall()
+
+
+# Function to turn plain search words into an FTS5 query, each word quoted so "C++" or "quick-sort" are not operators
+def quote_query(query):
+    return ' '.join('"' + term.replace('"', '""') + '"' for term in query.split())
+
+def main():
+    parser = argparse.ArgumentParser(description='Index the evaluation results in SQLite and search them.')
+    parser.add_argument('--db', default='result-index.sqlite', help='Path of the SQLite index')
+    parser.add_argument('--root', default='.', help='Repository root holding the result trees')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    subparsers.add_parser('update', help='Index new and changed result files')
+    search_parser = subparsers.add_parser('search', help='Full-text search over prompts and answers')
+    search_parser.add_argument('query', help='Words that must all appear, for example "binary search"')
+    search_parser.add_argument('--raw', action='store_true', help='Treat the query as FTS5 syntax (AND, OR, NEAR, prefix*)')
+    search_parser.add_argument('--in', dest='column', choices=['prompt', 'answer'], help='Search only prompts or only answers')
+    search_parser.add_argument('--model', help='Only return answers of this model')
+    search_parser.add_argument('--limit', type=int, default=50)
+    args = parser.parse_args()
+
+    index = ResultIndex(args.db, args.root)
+    try:
+        if args.command == 'update':
+            stats = index.update()
+            print(f"Indexed {stats['indexed']}, unchanged {stats['unchanged']}, removed {stats['removed']}, failed {stats['failed']}")
+        else:
+            try:
+                results = index.search(args.query, args.column, args.model, args.limit, args.raw)
+            except sqlite3.OperationalError as e:
+                print(f"Error: invalid search query: {e}")
+                return
+            for model, run, path, prompt, answer in results:
+                preview = ' '.join((answer or '').split())[:100]
+                print(f"{model} | {run} | {prompt}\n    {preview}")
+    finally:
+        index.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+import argparse
+import glob
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+WEB_SRC = os.path.join('code-assist-webUI', 'code-assist-web', 'src')
+CODE_BLOCK = re.compile(r"```[ \t]*([\w+-]*)[^\n]*\n(.*?)```", re.DOTALL)
+PYTHON_LANGUAGES = {'', 'python', 'py', 'python3'}
+
+# Set by the child itself before it reads the answer: preexec_fn is not safe while the scoring threads run
+HARNESS_LIMITS = '''
+try:
+    import resource
+    resource.setrlimit(resource.RLIMIT_CPU, ({cpu_seconds}, {cpu_seconds}))
+    resource.setrlimit(resource.RLIMIT_AS, ({memory}, {memory}))
+except ImportError:  # Not available on Windows, the time limit still applies there
+    pass
+'''
+
+# Loads only the imports, functions and classes of the answer, so example calls and input() prompts do not run
+HARNESS_PRELUDE = '''
+import ast, sys
+# Isolated mode leaves the working directory off sys.path, the support files live there
+sys.path.insert(0, ".")
+with open("answer.py", encoding="utf-8") as file:
+    tree = ast.parse(file.read())
+tree.body = [node for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom, ast.FunctionDef, ast.ClassDef))]
+namespace = {"__name__": "answer"}
+exec(compile(tree, "answer.py", "exec"), namespace)
+
+def find_function(*names):
+    for key, value in namespace.items():
+        if callable(value) and key.lower().replace("_", "") in names:
+            return value
+    sys.exit("FAIL: function not found")
+
+def positional_count(function):
+    import inspect
+    try:
+        return len([p for p in inspect.signature(function).parameters.values() if p.default is p.empty])
+    except (TypeError, ValueError):
+        return 1
+'''
+
+BINARY_SEARCH_TESTS = '''
+search = find_function("binarysearch", "binsearch", "search")
+cases = [([1, 3, 5, 7, 9, 11], 7), ([1, 3, 5, 7, 9, 11], 1), ([1, 3, 5, 7, 9, 11], 11), ([2, 4, 6, 8], 5), ([], 3), ([4], 4)]
+for arr, target in cases:
+    if positional_count(search) >= 4:
+        index = search(list(arr), 0, len(arr) - 1, target)
+    else:
+        index = search(list(arr), target)
+    found = index is not None and index is not False and index >= 0
+    if (target in arr) != found or (found and arr[index] != target):
+        sys.exit(f"FAIL: search({arr}, {target}) returned {index}")
+print("PASS")
+'''
+
+QUICK_SORT_TESTS = '''
+sort = find_function("quicksort", "quicksortalgorithm", "sort")
+cases = [[3, 6, 8, 10, 1, 2, 1], [], [1], [5, 4, 3, 2, 1], [2, 2, 2], [9, -3, 5, 0, 12, -7, 5]]
+for arr in cases:
+    data = list(arr)
+    if positional_count(sort) >= 3:
+        result = sort(data, 0, len(data) - 1)
+    else:
+        result = sort(data)
+    # Accept both returned lists and in-place sorting
+    output = result if isinstance(result, list) else data
+    if output != sorted(arr):
+        sys.exit(f"FAIL: sort({arr}) gave {output}")
+print("PASS")
+'''
+
+UNIT_TEST_TESTS = '''
+import unittest
+suite = unittest.TestSuite()
+loader = unittest.TestLoader()
+for key, value in list(namespace.items()):
+    if isinstance(value, type) and issubclass(value, unittest.TestCase) and value is not unittest.TestCase:
+        suite.addTests(loader.loadTestsFromTestCase(value))
+    elif callable(value) and key.startswith("test"):
+        suite.addTest(unittest.FunctionTestCase(value))
+result = unittest.TextTestRunner(stream=sys.stderr, verbosity=0).run(suite)
+if result.testsRun == 0:
+    sys.exit("FAIL: no tests found")
+if not result.wasSuccessful():
+    sys.exit(f"FAIL: {len(result.failures)} failures, {len(result.errors)} errors")
+print("PASS")
+'''
+
+# Scored prompts: the web UI method name, how to recognise the prompt, the reference tests and the files they need
+SCORED_PROMPTS = [
+    ("Binary Search (prompt-results)", re.compile(r'binary\s*search', re.IGNORECASE), BINARY_SEARCH_TESTS, []),
+    ("Quick Sort (prompt-results)", re.compile(r'quick[\s-]*sort', re.IGNORECASE), QUICK_SORT_TESTS, []),
+    ("Unit Test Case (prompt-results)", re.compile(r'unit\s*test.*@documentation\.py', re.IGNORECASE | re.DOTALL), UNIT_TEST_TESTS, ['documentation.py']),
+]
+
+
+# Function to pull the Python code out of an assistant answer
+def extract_code(answer):
+    blocks = [code for language, code in CODE_BLOCK.findall(answer) if language.lower() in PYTHON_LANGUAGES]
+    if blocks:
+        return '\n\n'.join(blocks)
+    # Answers copied from the chat window often have no fences at all
+    try:
+        compile(answer, 'answer.py', 'exec')
+        return answer
+    except (SyntaxError, ValueError):
+        return None
+
+# Function to run one answer against its reference tests in an isolated subprocess
+def run_answer(code, tests, support_files, root='.', time_limit=10, memory_mb=512):
+    with tempfile.TemporaryDirectory() as work_dir:
+        with open(os.path.join(work_dir, 'answer.py'), 'w', encoding='utf-8') as file:
+            file.write(code)
+        with open(os.path.join(work_dir, 'harness.py'), 'w', encoding='utf-8') as file:
+            file.write(HARNESS_LIMITS.format(cpu_seconds=time_limit, memory=memory_mb * 1024 * 1024) + HARNESS_PRELUDE + tests)
+        for name in support_files:
+            shutil.copy(os.path.join(root, name), work_dir)
+
+        try:
+            completed = subprocess.run(
+                [sys.executable, '-I', 'harness.py'],
+                cwd=work_dir, stdin=subprocess.DEVNULL, capture_output=True, text=True,
+                timeout=time_limit)
+        except subprocess.TimeoutExpired:
+            return False, "timed out"
+
+    if completed.returncode == 0 and completed.stdout.strip().endswith('PASS'):
+        return True, ""
+    reason = (completed.stderr.strip().splitlines() or [f"exit code {completed.returncode}"])[-1]
+    return False, reason
+
+# Function to collect the (model, method, answer) triples of every run file
+def collect_answers(results_dir):
+    answers = []
+    for path in sorted(glob.glob(os.path.join(results_dir, '*', '*.json'))):
+        try:
+            with open(path, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+        except (ValueError, OSError) as e:
+            print(f"Error: skipping {path}: {e}")
+            continue
+        for entries in data.values():
+            for entry in entries:
+                model = entry.get('name') or os.path.basename(os.path.dirname(path))
+                for item in entry.get('prompt', []):
+                    for method, pattern, tests, support_files in SCORED_PROMPTS:
+                        if pattern.search(item.get('user') or ''):
+                            answers.append((model, method, tests, support_files, item.get('assistant') or ''))
+    return answers
+
+# Function to score every answer in parallel and compute the pass rate per model and method
+def score(answers, root='.', workers=None, time_limit=10, memory_mb=512):
+    def score_one(answer):
+        model, method, tests, support_files, text = answer
+        code = extract_code(text)
+        if code is None:
+            return model, method, False, "no code found"
+        passed, reason = run_answer(code, tests, support_files, root, time_limit, memory_mb)
+        return model, method, passed, reason
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        verdicts = list(executor.map(score_one, answers))
+    elapsed = time.perf_counter() - start
+
+    summary = {}
+    for model, method, passed, reason in verdicts:
+        stats = summary.setdefault((model, method), {'total': 0, 'passed': 0, 'reasons': []})
+        stats['total'] += 1
+        stats['passed'] += passed
+        if not passed:
+            stats['reasons'].append(reason)
+    return summary, elapsed
+
+# Function to write the pass rates into code-assist-data.json, replacing earlier scores of the same method
+def update_code_assist_data(data_path, summary, elapsed):
+    with open(data_path, 'r', encoding='utf-8') as file:
+        data = json.load(file)
+    models = data.setdefault("0", [])
+
+    for (model, method), stats in sorted(summary.items()):
+        entry = next((item for item in models if item.get("Name") == model), None)
+        if entry is None:
+            entry = {"Name": model, "Data": []}
+            models.append(entry)
+        failures = sorted(set(stats['reasons']))
+        row = {
+            "Method": method,
+            "Number of Problems Evaluated": stats['total'],
+            "Duration": f"{elapsed / 60:.1f} minutes",
+            "Pass@1": f"{stats['passed'] / stats['total']:.3f}",
+            "BLEU Score": "Not applicable",
+            "Observation": f"{stats['passed']} of {stats['total']} generated answers passed the reference tests.",
+            "Response": "",
+            "Issue": "; ".join(failures[:3]),
+        }
+        entry["Data"] = [item for item in entry["Data"] if item.get("Method") != method] + [row]
+
+    tmp_path = data_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as file:
+        json.dump(data, file, indent=4, ensure_ascii=False)
+    os.replace(tmp_path, data_path)
+
+def main():
+    parser = argparse.ArgumentParser(description='Score generated code answers against reference tests.')
+    parser.add_argument('--results-dir', default=os.path.join(WEB_SRC, 'prompt-results'), help='prompt-results/<model>/*.json tree')
+    parser.add_argument('--data', default=os.path.join(WEB_SRC, 'code-assist-data.json'), help='File served by /api/code-assist')
+    parser.add_argument('--root', default='.', help='Directory holding the files the prompts refer to (e.g. documentation.py)')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count(), help='Answers scored in parallel')
+    parser.add_argument('--time-limit', type=int, default=10, help='CPU and wall-clock seconds per answer')
+    parser.add_argument('--memory-limit', type=int, default=512, help='Address space limit per answer in MB')
+    parser.add_argument('--dry-run', action='store_true', help='Print the pass rates without updating the data file')
+    args = parser.parse_args()
+
+    answers = collect_answers(args.results_dir)
+    if not answers:
+        print("No scorable answers found.")
+        return
+    summary, elapsed = score(answers, args.root, args.jobs, args.time_limit, args.memory_limit)
+
+    for (model, method), stats in sorted(summary.items()):
+        print(f"{model} | {method}: {stats['passed']}/{stats['total']} passed")
+    print(f"Scored {len(answers)} answers in {elapsed:.1f}s")
+
+    if not args.dry_run:
+        update_code_assist_data(args.data, summary, elapsed)
+        print(f"Updated {args.data}")
+
+if __name__ == "__main__":
+    main()
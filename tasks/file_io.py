@@ -1,22 +1,198 @@
 import json
+import os
+
+from tasks.repository import TaskRepository
 
 TASKS_FILE = "tasks.json"
+# Changes since the last snapshot, one JSON operation per line
+TASKS_LOG = "tasks.log"
+# The log is folded into a new snapshot once it holds more operations than this (or than there are tasks)
+COMPACT_AFTER = 1000
+
+
+class TaskList(list):
+    def __init__(self, tasks=(), sequence=0):
+        """A task list that remembers the operations made since it was last saved."""
+        super().__init__(tasks)
+        self.pending = []
+        self.sequence = sequence
+        self.file_state = None
+        self.log_operations = 0
+
+
+def record_change(tasks, op, **fields):
+    # Plain lists have no log, they are saved as a full snapshot
+    if isinstance(tasks, (TaskList, TaskRepository)):
+        tasks.pending.append(dict(fields, op=op))
+
+def _operation_target(tasks, operation):
+    # Repositories log task IDs, lists log positions; either kind of log replays into either container
+    if isinstance(tasks, TaskRepository):
+        return operation["id"] if "id" in operation else tasks.task_at(operation["index"])["id"]
+    if "index" in operation:
+        return operation["index"]
+    return next(i for i, task in enumerate(tasks) if task.get("id") == operation["id"])
+
+def apply_operation(tasks, operation):
+    op = operation["op"]
+    if op == "add":
+        if isinstance(tasks, TaskRepository):
+            tasks.insert(dict(operation["task"]))
+        else:
+            tasks.append(operation["task"])
+    elif op == "complete":
+        target = _operation_target(tasks, operation)
+        if isinstance(tasks, TaskRepository):
+            tasks.complete(target)
+        else:
+            tasks[target]["completed"] = True
+    elif op == "delete":
+        target = _operation_target(tasks, operation)
+        if isinstance(tasks, TaskRepository):
+            tasks.delete(target)
+        else:
+            tasks.pop(target)
+    else:
+        raise ValueError(f"Unknown operation '{op}'")
+
+def _file_state():
+    # Snapshot and log as this process last saw them, any difference means another writer was here
+    state = []
+    for path in (TASKS_FILE, TASKS_LOG):
+        try:
+            stat = os.stat(path)
+            state.append((stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            state.append(None)
+    return tuple(state)
+
+def _write_snapshot(tasks, sequence):
+    tmp_path = TASKS_FILE + ".tmp"
+    with open(tmp_path, "w") as file:
+        snapshot = {"sequence": sequence, "tasks": list(tasks)}
+        if isinstance(tasks, TaskRepository):
+            # Keeps IDs of deleted tasks from being handed out again after a reload
+            snapshot["next_id"] = tasks.next_id
+        json.dump(snapshot, file)
+        file.flush()
+        os.fsync(file.fileno())
+    # The rename is atomic, a crash leaves either the old or the new snapshot
+    os.replace(tmp_path, TASKS_FILE)
+    # Operations up to `sequence` are in the snapshot, so an old log is skipped even if this truncate never happens
+    open(TASKS_LOG, "w").close()
+
+def _append_log(tasks):
+    with open(TASKS_LOG, "a") as file:
+        for operation in tasks.pending:
+            tasks.sequence += 1
+            file.write(json.dumps(dict(operation, seq=tasks.sequence)) + "\n")
+        file.flush()
+        os.fsync(file.fileno())
+    tasks.log_operations += len(tasks.pending)
+
+def compact_tasks(tasks):
+    logged = isinstance(tasks, (TaskList, TaskRepository))
+    sequence = tasks.sequence + len(tasks.pending) if logged else 0
+    _write_snapshot(tasks, sequence)
+    if logged:
+        tasks.pending = []
+        tasks.sequence = sequence
+        tasks.file_state = _file_state()
+        tasks.log_operations = 0
+
+def _merge_saved(tasks):
+    # Another session saved since these tasks were loaded: reload its state and replay this session's
+    # operations on top. Repositories log task IDs, so the operations still name the right tasks.
+    saved = load_tasks(TaskRepository)
+    new_ids = {}
+    for operation in tasks.pending:
+        operation = dict(operation)
+        if operation["op"] == "add":
+            task = dict(operation["task"])
+            # The other session may have handed out (or deleted) this ID too
+            if task["id"] < saved.next_id:
+                new_ids[task["id"]] = saved.next_id
+                task["id"] = saved.next_id
+            operation["task"] = task
+        else:
+            operation["id"] = new_ids.get(operation["id"], operation["id"])
+            if operation["id"] not in saved:
+                # The other session deleted this task already
+                continue
+        apply_operation(saved, operation)
+        saved.pending.append(operation)
+    tasks.replace_with(saved)
 
 def save_tasks(tasks):
     try:
-        with open(TASKS_FILE, "w") as file:
-            json.dump(tasks, file)
+        merged = False
+        if isinstance(tasks, TaskRepository) and tasks.file_state is not None and tasks.file_state != _file_state():
+            _merge_saved(tasks)
+            merged = True
+
+        if not isinstance(tasks, (TaskList, TaskRepository)):
+            compact_tasks(tasks)
+        elif tasks.file_state is not None and tasks.file_state != _file_state():
+            # List positions shift with the other session's changes, so they cannot be replayed on top of them
+            return "Error saving tasks: another session changed the saved tasks, load them again before saving."
+        elif tasks.file_state is None or tasks.file_state[0] is None:
+            # No snapshot to append to yet, or a torn log that must not be appended after
+            compact_tasks(tasks)
+        else:
+            if tasks.pending:
+                _append_log(tasks)
+                tasks.pending = []
+                tasks.file_state = _file_state()
+            if tasks.log_operations > max(COMPACT_AFTER, len(tasks)):
+                compact_tasks(tasks)
+        if merged:
+            return "Tasks saved successfully, together with the changes of another session!"
         return "Tasks saved successfully!"
     except Exception as e:
         return f"Error saving tasks: {e}"
 
-def load_tasks():
+def load_tasks(container=TaskList):
     try:
         with open(TASKS_FILE, "r") as file:
-            return json.load(file)
+            snapshot = json.load(file)
     except FileNotFoundError:
-        return []
+        tasks = container()
+        # Lets the first save notice a task file another session created in the meantime
+        tasks.file_state = _file_state()
+        return tasks
     except Exception as e:
         print(f"Error loading tasks: {e}")
-        return []
+        return container()
+
+    # Files written before the log existed hold a plain list
+    if isinstance(snapshot, list):
+        snapshot = {"sequence": 0, "tasks": snapshot}
+    tasks = container(snapshot["tasks"], snapshot["sequence"])
+    if isinstance(tasks, TaskRepository):
+        tasks.next_id = max(tasks.next_id, snapshot.get("next_id", 1))
+
+    try:
+        with open(TASKS_LOG, "r") as file:
+            for line in file:
+                try:
+                    operation = json.loads(line)
+                except json.JSONDecodeError:
+                    # A crash mid-append leaves a torn last line, everything before it is intact.
+                    # The next save rewrites the snapshot instead of appending after it.
+                    tasks.file_state = None
+                    break
+                if operation["seq"] <= tasks.sequence:
+                    continue
+                apply_operation(tasks, operation)
+                tasks.sequence = operation["seq"]
+                tasks.log_operations += 1
+            else:
+                tasks.file_state = _file_state()
+    except FileNotFoundError:
+        tasks.file_state = _file_state()
+    except Exception as e:
+        print(f"Error replaying task log: {e}")
+    return tasks
 
+def load_repository():
+    return load_tasks(TaskRepository)
@@ -1,23 +1,122 @@
 # tasks/manager.py
+from itertools import islice
+
 from utils.validation import validate_priority, validate_task_number
+from tasks.file_io import record_change
+from tasks.repository import TaskRepository
+
+# The functions take either a list of task dicts, addressed by 1-based position,
+# or a TaskRepository, where the task number is the task's stable ID.
+
+def _validate_task(tasks, task_number):
+    if isinstance(tasks, TaskRepository):
+        if not tasks:
+            return False, "No tasks available to choose from!"
+        if task_number not in tasks:
+            return False, "Invalid task number!"
+        return True, None
+    return validate_task_number(tasks, task_number)
 
 def add_task(tasks, name, priority):
     if not name:
         return "Task name cannot be empty!"
     priority = validate_priority(priority)
-    tasks.append({"name": name, "completed": False, "priority": priority})
+    if isinstance(tasks, TaskRepository):
+        task = tasks.add(name, priority)
+    else:
+        task = {"name": name, "completed": False, "priority": priority}
+        tasks.append(task)
+    record_change(tasks, "add", task=dict(task))
     return f"Task '{name}' added with priority '{priority}'."
 
+# Sort orders for view_tasks, they follow the repository indexes so no full sort is needed
+PRIORITY_ORDER = ("High", "Medium", "Low")
+STATUS_ORDER = (False, True)
+
+def format_task(number, task):
+    status = "Done" if task["completed"] else "Pending"
+    return f"{number}. {task['name']} [{task['priority']}] - {status}"
+
+def _matches(task, priority, completed):
+    return (priority is None or task["priority"] == priority) and (completed is None or task["completed"] == completed)
+
+def iter_tasks(tasks, priority=None, completed=None, sort_by=None):
+    # Yields (task number, task) lazily, so showing the first page never touches the rest
+    if sort_by == "priority":
+        passes = [(p, completed) for p in PRIORITY_ORDER if priority in (None, p)]
+    elif sort_by == "status":
+        passes = [(priority, c) for c in STATUS_ORDER if completed in (None, c)]
+    elif sort_by is None:
+        passes = [(priority, completed)]
+    else:
+        raise ValueError("sort_by must be 'priority', 'status' or None.")
+
+    for pass_priority, pass_completed in passes:
+        if isinstance(tasks, TaskRepository):
+            for task in tasks.find(priority=pass_priority, completed=pass_completed):
+                yield task["id"], task
+        else:
+            for number, task in enumerate(tasks, start=1):
+                if _matches(task, pass_priority, pass_completed):
+                    yield number, task
+
+def iter_task_lines(tasks, priority=None, completed=None, sort_by=None):
+    for number, task in iter_tasks(tasks, priority, completed, sort_by):
+        yield format_task(number, task)
+
+def count_tasks(tasks, priority=None, completed=None):
+    # Returns None when counting would mean scanning every task
+    if isinstance(tasks, TaskRepository):
+        if priority is not None and completed is not None:
+            return None
+        return tasks.count(priority=priority, completed=completed)
+    if priority is None and completed is None:
+        return len(tasks)
+    return None
+
+def view_tasks(tasks, page=None, page_size=20, priority=None, completed=None, sort_by=None):
+    if not tasks:
+        return "No tasks available."
+    lines = iter_task_lines(tasks, priority, completed, sort_by)
+    if page is None:
+        return "\n".join(lines) or "No matching tasks."
+
+    start = (page - 1) * page_size
+    # One extra line tells whether another page follows without counting the rest
+    page_lines = list(islice(lines, start, start + page_size + 1))
+    if not page_lines:
+        return f"No tasks on page {page}."
+    has_next = len(page_lines) > page_size
+    page_lines = page_lines[:page_size]
+
+    total = count_tasks(tasks, priority, completed)
+    if total is not None:
+        footer = f"Page {page} of {(total + page_size - 1) // page_size} ({total} tasks)"
+    else:
+        footer = f"Page {page}" + (", more tasks follow" if has_next else ", last page")
+    return "\n".join(page_lines + [footer])
+
 def mark_task_completed(tasks, task_number):
-    is_valid, message = validate_task_number(tasks, task_number)
+    is_valid, message = _validate_task(tasks, task_number)
     if not is_valid:
         return message
-    tasks[task_number - 1]["completed"] = True
-    return f"Task '{tasks[task_number - 1]['name']}' marked as completed!"
+    if isinstance(tasks, TaskRepository):
+        task = tasks.complete(task_number)
+        record_change(tasks, "complete", id=task_number)
+    else:
+        task = tasks[task_number - 1]
+        task["completed"] = True
+        record_change(tasks, "complete", index=task_number - 1)
+    return f"Task '{task['name']}' marked as completed!"
 
 def delete_task(tasks, task_number):
-    is_valid, message = validate_task_number(tasks, task_number)
+    is_valid, message = _validate_task(tasks, task_number)
     if not is_valid:
         return message
-    removed_task = tasks.pop(task_number - 1)
+    if isinstance(tasks, TaskRepository):
+        removed_task = tasks.delete(task_number)
+        record_change(tasks, "delete", id=task_number)
+    else:
+        removed_task = tasks.pop(task_number - 1)
+        record_change(tasks, "delete", index=task_number - 1)
     return f"Task '{removed_task['name']}' deleted."
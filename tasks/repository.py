@@ -0,0 +1,135 @@
+# tasks/repository.py
+from utils.validation import validate_priority
+
+
+class TaskRepository:
+    def __init__(self, tasks=(), sequence=0):
+        """Tasks keyed by stable IDs, with indexes on name, priority and completion status."""
+        self.tasks = {}
+        self.by_name = {}
+        self.by_priority = {}
+        self.by_completed = {False: {}, True: {}}
+        self.next_id = 1
+        # Persistence bookkeeping, the same as tasks.file_io.TaskList
+        self.pending = []
+        self.sequence = sequence
+        self.file_state = None
+        self.log_operations = 0
+        for task in tasks:
+            self.insert(dict(task))
+
+    def __len__(self):
+        return len(self.tasks)
+
+    def __iter__(self):
+        """Iterate over the tasks in the order they were added."""
+        return iter(self.tasks.values())
+
+    def __contains__(self, task_id):
+        return task_id in self.tasks
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def replace_with(self, other):
+        """Take over the tasks, indexes and bookkeeping of another repository, e.g. one merged with a newer save."""
+        for name in ("tasks", "by_name", "by_priority", "by_completed", "next_id",
+                     "pending", "sequence", "file_state", "log_operations"):
+            setattr(self, name, getattr(other, name))
+
+    def _index(self, task):
+        """Add a task's ID to the secondary indexes (dicts keep insertion order and delete in O(1))."""
+        # Names are mostly unique, so a name maps to a bare ID until a second task shares it
+        existing = self.by_name.get(task["name"])
+        if existing is None:
+            self.by_name[task["name"]] = task["id"]
+        elif isinstance(existing, dict):
+            existing[task["id"]] = None
+        else:
+            self.by_name[task["name"]] = {existing: None, task["id"]: None}
+        self.by_priority.setdefault(task["priority"], {})[task["id"]] = None
+        self.by_completed[task["completed"]][task["id"]] = None
+
+    def _unindex(self, task):
+        """Remove a task's ID from the secondary indexes."""
+        ids = self.by_name[task["name"]]
+        if isinstance(ids, dict):
+            del ids[task["id"]]
+            if len(ids) == 1:
+                self.by_name[task["name"]] = next(iter(ids))
+        else:
+            del self.by_name[task["name"]]
+        del self.by_priority[task["priority"]][task["id"]]
+        if not self.by_priority[task["priority"]]:
+            del self.by_priority[task["priority"]]
+        del self.by_completed[task["completed"]][task["id"]]
+
+    def insert(self, task):
+        """Store a task that already has its fields (and possibly an ID), e.g. when loading."""
+        if "id" not in task:
+            task["id"] = self.next_id
+        task.setdefault("completed", False)
+        self.next_id = max(self.next_id, task["id"] + 1)
+        self.tasks[task["id"]] = task
+        self._index(task)
+        return task
+
+    def add(self, name, priority):
+        """Add a new task and return it."""
+        return self.insert({"id": self.next_id, "name": name, "completed": False, "priority": validate_priority(priority)})
+
+    def get(self, task_id):
+        """Return the task with this ID, or None."""
+        return self.tasks.get(task_id)
+
+    def complete(self, task_id):
+        """Mark a task as completed in O(1)."""
+        task = self.tasks[task_id]
+        if not task["completed"]:
+            del self.by_completed[False][task_id]
+            task["completed"] = True
+            self.by_completed[True][task_id] = None
+        return task
+
+    def delete(self, task_id):
+        """Delete a task in O(1), the IDs of the other tasks do not change."""
+        task = self.tasks.pop(task_id)
+        self._unindex(task)
+        return task
+
+    def task_at(self, index):
+        """Return the task at a 0-based position, for operations recorded on a plain list (O(n))."""
+        for position, task in enumerate(self.tasks.values()):
+            if position == index:
+                return task
+        raise IndexError("task index out of range")
+
+    def find(self, name=None, priority=None, completed=None):
+        """Yield the tasks matching every given field, starting from the smallest index."""
+        candidates = []
+        if name is not None:
+            ids = self.by_name.get(name, {})
+            candidates.append(ids if isinstance(ids, dict) else {ids: None})
+        if priority is not None:
+            candidates.append(self.by_priority.get(priority, {}))
+        if completed is not None:
+            candidates.append(self.by_completed[bool(completed)])
+        if not candidates:
+            yield from self
+            return
+
+        candidates.sort(key=len)
+        for task_id in candidates[0]:
+            if all(task_id in index for index in candidates[1:]):
+                yield self.tasks[task_id]
+
+    def count(self, name=None, priority=None, completed=None):
+        """Number of tasks matching the given fields."""
+        if name is None and priority is None and completed is None:
+            return len(self.tasks)
+        if name is None and (priority is None) != (completed is None):
+            # A single index answers this in O(1)
+            if priority is not None:
+                return len(self.by_priority.get(priority, {}))
+            return len(self.by_completed[bool(completed)])
+        return sum(1 for _ in self.find(name, priority, completed))
@@ -0,0 +1,135 @@
+# tasks/storage.py
+import sqlite3
+
+from tasks.file_io import load_repository, save_tasks
+from tasks.repository import TaskRepository
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    completed INTEGER NOT NULL DEFAULT 0,
+    priority TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tasks_priority ON tasks (priority, completed);
+CREATE INDEX IF NOT EXISTS tasks_completed ON tasks (completed);
+"""
+
+# Fixed statements, sqlite3 prepares each once and reuses it from its statement cache
+SELECT_TASKS = "SELECT id, name, completed, priority FROM tasks ORDER BY id"
+SELECT_NEXT_ID = "SELECT seq FROM sqlite_sequence WHERE name = 'tasks'"
+INSERT_WITH_ID = "INSERT OR IGNORE INTO tasks (id, name, completed, priority) VALUES (?, ?, ?, ?)"
+INSERT_TASK = "INSERT INTO tasks (name, completed, priority) VALUES (?, ?, ?)"
+COMPLETE_TASK = "UPDATE tasks SET completed = 1 WHERE id = ?"
+DELETE_TASK = "DELETE FROM tasks WHERE id = ?"
+DELETE_ALL = "DELETE FROM tasks"
+ROW_UPDATES = {"complete": COMPLETE_TASK, "delete": DELETE_TASK}
+
+
+class JsonFileBackend:
+    def load(self):
+        """Load the tasks from tasks.json and its operation log."""
+        return load_repository()
+
+    def save(self, tasks):
+        """Append the pending changes to the operation log."""
+        return save_tasks(tasks)
+
+    def close(self):
+        pass
+
+
+class SQLiteBackend:
+    def __init__(self, path="tasks.sqlite", timeout=10.0):
+        """Open (or create) a task database that several processes can share."""
+        self.connection = sqlite3.connect(path, timeout=timeout, isolation_level=None)
+        # WAL lets readers keep reading while one process writes
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(SCHEMA)
+
+    def load(self):
+        """Read every task into a repository, keyed by its row ID."""
+        tasks = TaskRepository()
+        for task_id, name, completed, priority in self.connection.execute(SELECT_TASKS):
+            tasks.insert({"id": task_id, "name": name, "completed": bool(completed), "priority": priority})
+        # IDs of deleted rows are not handed out again
+        row = self.connection.execute(SELECT_NEXT_ID).fetchone()
+        if row:
+            tasks.next_id = max(tasks.next_id, row[0] + 1)
+        return tasks
+
+    def save(self, tasks):
+        """Write the pending changes as row-level statements in one transaction."""
+        try:
+            # IMMEDIATE takes the write lock up front, a second writer waits for it instead of failing mid-way
+            self.connection.execute("BEGIN IMMEDIATE")
+            try:
+                if isinstance(tasks, TaskRepository):
+                    self._apply(tasks)
+                else:
+                    self._replace(tasks)
+                self.connection.execute("COMMIT")
+            except BaseException:
+                self.connection.execute("ROLLBACK")
+                raise
+            if isinstance(tasks, TaskRepository):
+                tasks.pending = []
+            return "Tasks saved successfully!"
+        except Exception as e:
+            return f"Error saving tasks: {e}"
+
+    def _apply(self, tasks):
+        """Run the pending operations, batching consecutive completes and deletes into executemany."""
+        # Another process may have taken an ID this one handed out, or taken and deleted it again,
+        # so only IDs above the highest one ever assigned are kept, the rest get a new row ID
+        row = self.connection.execute(SELECT_NEXT_ID).fetchone()
+        last_id = row[0] if row else 0
+        renamed = {}
+        batch_sql, batch = None, []
+        for operation in tasks.pending:
+            if operation["op"] == "add":
+                if batch:
+                    self.connection.executemany(batch_sql, batch)
+                    batch_sql, batch = None, []
+                task = operation["task"]
+                values = (task["name"], int(task["completed"]), task["priority"])
+                if task["id"] > last_id and self.connection.execute(INSERT_WITH_ID, (task["id"],) + values).rowcount:
+                    last_id = task["id"]
+                else:
+                    last_id = renamed[task["id"]] = self.connection.execute(INSERT_TASK, values).lastrowid
+                continue
+
+            if operation["op"] not in ROW_UPDATES:
+                raise ValueError(f"Unknown operation '{operation['op']}'")
+            sql = ROW_UPDATES[operation["op"]]
+            if sql != batch_sql and batch:
+                self.connection.executemany(batch_sql, batch)
+                batch = []
+            batch_sql = sql
+            batch.append((renamed.get(operation["id"], operation["id"]),))
+        if batch:
+            self.connection.executemany(batch_sql, batch)
+
+        # Take the renamed tasks out first, a new ID may still be held by another renamed task
+        moved = [(tasks.delete(old_id), new_id) for old_id, new_id in renamed.items() if old_id in tasks]
+        for task, new_id in moved:
+            task["id"] = new_id
+            tasks.insert(task)
+
+    def _replace(self, tasks):
+        """Store a plain list of tasks as the whole table."""
+        self.connection.execute(DELETE_ALL)
+        self.connection.executemany(INSERT_TASK, ((task["name"], int(task["completed"]), task["priority"]) for task in tasks))
+
+    def close(self):
+        self.connection.close()
+
+
+# Function to open the storage backend chosen on the command line
+def open_backend(name="json", path=None):
+    if name == "json":
+        return JsonFileBackend()
+    if name == "sqlite":
+        return SQLiteBackend(path or "tasks.sqlite")
+    raise ValueError(f"Unknown storage backend '{name}'")
@@ -0,0 +1,59 @@
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+from tasks.columnar import PRIORITIES, TaskColumns
+from tasks.repository import TaskRepository
+
+# Function to generate task dicts shaped like the ones tasks/manager.py creates
+def generate_tasks(count):
+    for i in range(count):
+        yield {"name": f"Task number {i}", "completed": i % 4 == 0, "priority": PRIORITIES[i % 3]}
+
+# Function to measure the memory a structure holds once it is built
+def measure(build):
+    tracemalloc.start()
+    result = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare memory per task of dicts, the repository and the columnar store.')
+    parser.add_argument('-n', '--tasks', type=int, default=1000000, help='Number of tasks to generate')
+    args = parser.parse_args()
+
+    rows = []
+    tasks, size = measure(lambda: list(generate_tasks(args.tasks)))
+    rows.append(("list of dicts", size))
+    repository, size = measure(lambda: TaskRepository(tasks))
+    rows.append(("TaskRepository", size))
+    del repository
+    columns, size = measure(lambda: TaskColumns.from_tasks(tasks))
+    rows.append(("TaskColumns", size))
+    del tasks
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'tasks.col')
+        columns.save(path)
+        file_size = os.path.getsize(path)
+        # Timed without tracemalloc, which slows allocation down
+        start = time.perf_counter()
+        mapped = TaskColumns.load(path)
+        middle = mapped[args.tasks // 2]
+        load_time = time.perf_counter() - start
+        mapped.close()
+        mapped, size = measure(lambda: TaskColumns.load(path))
+        rows.append(("TaskColumns (mmap)", size))
+        mapped.close()
+
+    print(f"{args.tasks} tasks, e.g. {middle}")
+    for name, size in rows:
+        print(f"{name:<20} {size / args.tasks:8.1f} bytes/task {size / 2**20:9.1f} MiB")
+    print(f"Columnar file: {file_size / args.tasks:.1f} bytes/task ({file_size / 2**20:.1f} MiB), "
+          f"mapped and first task read in {load_time * 1000:.2f} ms")
+
+if __name__ == "__main__":
+    main()
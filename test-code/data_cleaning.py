@@ -1,32 +1,94 @@
 import numpy as np
+import pandas as pd
 
-def remove_outliers(data):
-    mean = np.mean(data)
-    std_dev = np.std(data)
-    cleaned_data = [x for x in data if (mean - 2*std_dev) <= x <= (mean + 2*std_dev)]
-    
-    if len(cleaned_data) == 0:
+# All functions take a list, a 1-D/2-D NumPy array, a pandas Series or a DataFrame.
+# 2-D inputs are cleaned column by column and statistics ignore NaN values.
+
+def _as_array(data, copy=True):
+    if isinstance(data, (pd.Series, pd.DataFrame)):
+        return data.to_numpy(dtype=float, copy=copy)
+    return np.array(data, dtype=float) if copy else np.asarray(data, dtype=float)
+
+def _is_float(data):
+    if isinstance(data, pd.Series):
+        return pd.api.types.is_float_dtype(data.dtype)
+    if isinstance(data, pd.DataFrame):
+        return all(pd.api.types.is_float_dtype(dtype) for dtype in data.dtypes)
+    return isinstance(data, np.ndarray) and np.issubdtype(data.dtype, np.floating)
+
+def _output_array(data, inplace):
+    if not inplace:
+        return _as_array(data)
+    # Integer columns cannot hold the scaled or filled values
+    if not _is_float(data):
+        raise TypeError("In-place cleaning needs float data: a float NumPy array, Series or DataFrame.")
+    # pandas objects are written back by _wrap, so their values can be copied out
+    if isinstance(data, (pd.Series, pd.DataFrame)):
+        return _as_array(data)
+    return data
+
+def _wrap(data, values, inplace=False):
+    if isinstance(data, pd.Series):
+        if inplace:
+            data.iloc[:] = values
+            return data
+        return pd.Series(values, index=data.index, name=data.name)
+    if isinstance(data, pd.DataFrame):
+        if inplace:
+            data.iloc[:, :] = values
+            return data
+        return pd.DataFrame(values, index=data.index, columns=data.columns)
+    return values
+
+def _column_stats(values):
+    total = values.sum(axis=0)
+    # A NaN makes its column sum NaN, so the slower NaN-aware reductions only run when they are needed
+    if np.isnan(total).any():
+        return np.nanmean(values, axis=0), np.nanstd(values, axis=0)
+    mean = total / len(values)
+    centered = values - mean
+    squares = np.einsum('ij,ij->j' if values.ndim == 2 else 'i,i->', centered, centered)
+    return mean, np.sqrt(squares / len(values))
+
+def outlier_mask(data, n_std=2):
+    values = _as_array(data, copy=False)
+    mean, std_dev = _column_stats(values)
+    lower, upper = mean - n_std * std_dev, mean + n_std * std_dev
+    # Missing values are not outliers, they are kept for fill_missing_values
+    mask = ((values >= lower) & (values <= upper)) | np.isnan(values)
+    # A row of a 2-D input is kept only if every column is within range
+    return mask.all(axis=1) if mask.ndim == 2 else mask
+
+def remove_outliers(data, n_std=2):
+    mask = outlier_mask(data, n_std)
+    if not mask.any():
         raise ValueError("All data points are considered outliers.")
-    
-    return cleaned_data
-
-def normalize_data(data):
-    min_val = np.min(data)
-    max_val = np.max(data)
-    normalized_data = [(x - min_val) / (max_val - min_val) for x in data]
-    
-    return normalized_data
-
-def fill_missing_values(data, method='mean'):
-    data = np.array(data)
+
+    if isinstance(data, (pd.Series, pd.DataFrame)):
+        return data[mask]
+    return _as_array(data, copy=False)[mask]
+
+def normalize_data(data, inplace=False):
+    values = _output_array(data, inplace)
+    min_val = np.nanmin(values, axis=0)
+    value_range = np.nanmax(values, axis=0) - min_val
+    # Constant columns map to 0 instead of dividing by zero
+    value_range = np.where(value_range == 0, 1, value_range)
+
+    np.subtract(values, min_val, out=values)
+    np.divide(values, value_range, out=values)
+    return _wrap(data, values, inplace)
+
+def fill_missing_values(data, method='mean', inplace=False):
+    values = _output_array(data, inplace)
     if method == 'mean':
-        fill_value = np.nanmean(data)
+        fill_value = np.nanmean(values, axis=0)
     elif method == 'median':
-        fill_value = np.nanmedian(data)
+        fill_value = np.nanmedian(values, axis=0)
     elif method == 'zero':
         fill_value = 0
     else:
         raise ValueError("Method must be 'mean', 'median', or 'zero'.")
-    
-    data[np.isnan(data)] = fill_value
-    return data.tolist()
+
+    np.copyto(values, fill_value, where=np.isnan(values))
+    return _wrap(data, values, inplace)
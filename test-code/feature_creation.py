@@ -1,32 +1,81 @@
 import numpy as np
 import pandas as pd
-def create_interaction_features(X):
+
+try:
+    from scipy import sparse as sp
+except ImportError:  # Only needed for sparse=True
+    sp = None
+
+# The generators below preallocate their output once and fill it with broadcasting.
+# dtype=np.float32 halves the memory, out= can be a np.memmap for results larger than RAM.
+
+def _output(shape, dtype, out):
+    if out is None:
+        return np.empty(shape, dtype=dtype)
+    if out.shape != shape:
+        raise ValueError(f"out has shape {out.shape}, expected {shape}.")
+    return out
+
+def _to_sparse(chunks):
+    if sp is None:
+        raise ImportError("sparse=True needs scipy.")
+    return sp.vstack([sp.csr_matrix(chunk) for chunk in chunks], format='csr')
+
+def create_interaction_features(X, dtype=np.float64, out=None, sparse=False, chunk_size=10000):
+    if sparse:
+        # Converting chunk by chunk keeps only one dense chunk in memory
+        return _to_sparse(iter_feature_chunks(X, create_interaction_features, chunk_size, dtype=dtype))
+
+    X = np.asarray(X, dtype=dtype)
+    n_features = X.shape[1]
+    result = _output((X.shape[0], n_features * (n_features - 1) // 2), dtype, out)
+
+    # Column i times every later column, written straight into its slice of the output
+    start = 0
+    for i in range(n_features - 1):
+        end = start + n_features - 1 - i
+        np.multiply(X[:, i:i + 1], X[:, i + 1:], out=result[:, start:end])
+        start = end
+    return result
+
+def polynomial_features(X, degree=2, dtype=np.float64, out=None, sparse=False, chunk_size=10000):
+    if sparse:
+        return _to_sparse(iter_feature_chunks(X, polynomial_features, chunk_size, degree=degree, dtype=dtype))
+
+    X = np.asarray(X, dtype=dtype)
     n_features = X.shape[1]
-    interaction_features = []
-    
-    for i in range(n_features):
-        for j in range(i+1, n_features):
-            interaction_features.append(X[:, i] * X[:, j])
-    
-    return np.column_stack(interaction_features)
-
-def polynomial_features(X, degree=2):
-    n_samples, n_features = X.shape
-    poly_features = [X]
-    
-    for d in range(2, degree+1):
-        poly_features.append(np.power(X, d))
-    
-    return np.column_stack(poly_features)
-
-def binning(X, bins=5):
-    binned_features = []
-    
-    for i in range(X.shape[1]):
-        binned_feature = np.digitize(X[:, i], bins=np.linspace(np.min(X[:, i]), np.max(X[:, i]), bins + 1))
-        binned_features.append(binned_feature)
-    
-    return np.column_stack(binned_features)
+    result = _output((X.shape[0], n_features * degree), dtype, out)
+
+    result[:, :n_features] = X
+    # Each power is the previous block times X, cheaper than np.power
+    for d in range(1, degree):
+        np.multiply(result[:, (d - 1) * n_features:d * n_features], X, out=result[:, d * n_features:(d + 1) * n_features])
+    return result
+
+def binning(X, bins=5, out=None):
+    X = np.asarray(X, dtype=float)
+    result = _output(X.shape, np.intp, out)
+    min_val = X.min(axis=0)
+    max_val = X.max(axis=0)
+    width = (max_val - min_val) / bins
+    edges = np.linspace(min_val, max_val, bins + 1)
+    columns = np.arange(X.shape[1])
+
+    # Same bin numbers as np.digitize over np.linspace(min, max, bins + 1), for all columns at once
+    with np.errstate(divide='ignore', invalid='ignore'):
+        position = np.floor((X - min_val) / width)
+    position[:, width == 0] = bins
+    position = np.clip(position, 0, bins).astype(np.intp)
+    # The division can round across an edge (e.g. a column's own maximum), so check against the real edges
+    position -= X < edges[position, columns]
+    position += (position < bins) & (X >= edges[np.minimum(position + 1, bins), columns])
+    np.add(position, 1, out=result)
+    return result
+
+def iter_feature_chunks(X, feature_function, chunk_size=10000, **kwargs):
+    # Yields the features of chunk_size rows at a time, e.g. to stream them to disk or into a model
+    for start in range(0, X.shape[0], chunk_size):
+        yield feature_function(X[start:start + chunk_size], **kwargs)
 
 def extract_datetime_features(df, datetime_column):
     df[datetime_column] = pd.to_datetime(df[datetime_column])
@@ -10,10 +10,10 @@ from regression import linear_regression, predict
 # Example data
 data = [10, 20, 30, 40, 50, 60, 70, 80, 90, 100, np.nan, 120, 130]
 
-# Step 1: Data Cleaning and Preprocessing
-data_cleaned = remove_outliers(data)
-data_filled = fill_missing_values(data_cleaned)
-data_normalized = normalize_data(data_filled)
+# Step 1: Data Cleaning and Preprocessing (fill first, a NaN would otherwise skew the outlier bounds)
+data_filled = fill_missing_values(data)
+data_cleaned = remove_outliers(data_filled)
+data_normalized = normalize_data(data_cleaned)
 
 # Step 2: Feature Engineering
 X = np.array([[1, 2], [3, 4], [5, 6], [7, 8]])
@@ -1,30 +1,125 @@
 import numpy as np
 
-def linear_regression(X, y):
-    X = np.column_stack((np.ones(len(X)), X))
-    theta = np.linalg.inv(X.T.dot(X)).dot(X.T).dot(y)
+def _add_intercept(X):
+    X = np.asarray(X, dtype=float)
+    if X.ndim == 1:
+        X = X[:, None]
+    design = np.empty((X.shape[0], X.shape[1] + 1))
+    design[:, 0] = 1
+    design[:, 1:] = X
+    return design
+
+def _solve_cholesky(A, b):
+    # A is symmetric positive definite: A = L L^T, then two triangular solves
+    L = np.linalg.cholesky(A)
+    return np.linalg.solve(L.T, np.linalg.solve(L, b))
+
+def linear_regression(X, y, method='lstsq'):
+    X = _add_intercept(X)
+    y = np.asarray(y, dtype=float)
+    if method == 'lstsq':
+        theta = np.linalg.lstsq(X, y, rcond=None)[0]
+    elif method == 'qr':
+        Q, R = np.linalg.qr(X)
+        theta = np.linalg.solve(R, Q.T.dot(y))
+    elif method == 'cholesky':
+        theta = _solve_cholesky(X.T.dot(X), X.T.dot(y))
+    else:
+        raise ValueError("Method must be 'lstsq', 'qr', or 'cholesky'.")
     return theta
 
 def predict(X, theta):
-    X = np.column_stack((np.ones(len(X)), X))
-    return X.dot(theta)
+    X = np.asarray(X, dtype=float)
+    if X.ndim == 1:
+        X = X[:, None]
+    return theta[0] + X.dot(theta[1:])
 
 def ridge_regression(X, y, alpha=1.0):
-    X = np.column_stack((np.ones(len(X)), X))
-    I = np.eye(X.shape[1])
-    I[0, 0] = 0  # Do not regularize the intercept
-    theta = np.linalg.inv(X.T.dot(X) + alpha * I).dot(X.T).dot(y)
-    return theta
+    X = _add_intercept(X)
+    A = X.T.dot(X)
+    # Do not regularize the intercept
+    A[np.arange(1, A.shape[0]), np.arange(1, A.shape[0])] += alpha
+    return _solve_cholesky(A, X.T.dot(np.asarray(y, dtype=float)))
 
-def lasso_regression(X, y, alpha=0.1, num_iterations=1000, learning_rate=0.01):
-    m, n = X.shape
-    X = np.column_stack((np.ones(m), X))
-    theta = np.zeros(n + 1)
-    
+# Coordinate descent on the Gram form of the centered problem, each update costs O(features) instead of O(rows)
+def _lasso_gram(G, b, alpha, num_iterations, tol, weights):
+    diagonal = np.diag(G)
     for _ in range(num_iterations):
-        predictions = X.dot(theta)
-        residuals = predictions - y
-        gradient = (1/m) * X.T.dot(residuals) + alpha * np.sign(theta)
-        theta -= learning_rate * gradient
-    
-    return theta
+        max_change = 0.0
+        for j in range(len(weights)):
+            if diagonal[j] == 0:
+                continue
+            old = weights[j]
+            rho = b[j] - G[j].dot(weights) + diagonal[j] * old
+            weights[j] = np.sign(rho) * max(abs(rho) - alpha, 0.0) / diagonal[j]
+            max_change = max(max_change, abs(weights[j] - old))
+        if max_change < tol:
+            break
+    return weights
+
+def _lasso_from_gram(G, b, x_mean, y_mean, alpha, num_iterations, tol, theta):
+    # A previous theta (e.g. from a larger alpha) is a warm start and usually converges in a few sweeps
+    weights = np.zeros(len(b)) if theta is None else np.array(theta[1:], dtype=float)
+    weights = _lasso_gram(G, b, alpha, num_iterations, tol, weights)
+    # The intercept is not penalized, it follows from the means
+    return np.concatenate(([y_mean - x_mean.dot(weights)], weights))
+
+def lasso_regression(X, y, alpha=0.1, num_iterations=1000, tol=1e-6, theta=None):
+    X = np.asarray(X, dtype=float)
+    y = np.asarray(y, dtype=float)
+    m = X.shape[0]
+    x_mean = X.mean(axis=0)
+    y_mean = y.mean()
+    centered = X - x_mean
+    G = centered.T.dot(centered) / m
+    b = centered.T.dot(y - y_mean) / m
+    return _lasso_from_gram(G, b, x_mean, y_mean, alpha, num_iterations, tol, theta)
+
+def iter_chunks(X, y, chunk_size=100000):
+    # Works with np.memmap / np.load(..., mmap_mode='r') so only one chunk is read at a time
+    for start in range(0, len(y), chunk_size):
+        yield X[start:start + chunk_size], y[start:start + chunk_size]
+
+def linear_regression_chunks(chunks, alpha=0.0):
+    # Incremental (TSQR) least squares: the R factor of [X y] is updated chunk by chunk
+    R = None
+    for X_chunk, y_chunk in chunks:
+        block = np.column_stack((_add_intercept(X_chunk), np.asarray(y_chunk, dtype=float)))
+        if R is not None:
+            block = np.vstack((R, block))
+        R = np.linalg.qr(block, mode='r')
+    if R is None:
+        raise ValueError("No data to fit.")
+
+    n = R.shape[1] - 1
+    if alpha:
+        # Ridge: append sqrt(alpha) rows for every coefficient except the intercept
+        penalty = np.zeros((n - 1, n + 1))
+        penalty[np.arange(n - 1), np.arange(1, n)] = np.sqrt(alpha)
+        R = np.linalg.qr(np.vstack((R, penalty)), mode='r')
+    return np.linalg.solve(R[:n, :n], R[:n, n])
+
+def lasso_regression_chunks(chunks, alpha=0.1, num_iterations=1000, tol=1e-6, theta=None):
+    # One pass accumulates the sums and cross products, coordinate descent then never touches the rows again
+    count = 0
+    for X_chunk, y_chunk in chunks:
+        X_chunk = np.asarray(X_chunk, dtype=float)
+        y_chunk = np.asarray(y_chunk, dtype=float)
+        if count == 0:
+            x_sum = np.zeros(X_chunk.shape[1])
+            y_sum = 0.0
+            XtX = np.zeros((X_chunk.shape[1], X_chunk.shape[1]))
+            Xty = np.zeros(X_chunk.shape[1])
+        count += len(y_chunk)
+        x_sum += X_chunk.sum(axis=0)
+        y_sum += y_chunk.sum()
+        XtX += X_chunk.T.dot(X_chunk)
+        Xty += X_chunk.T.dot(y_chunk)
+    if count == 0:
+        raise ValueError("No data to fit.")
+
+    x_mean = x_sum / count
+    y_mean = y_sum / count
+    G = XtX / count - np.outer(x_mean, x_mean)
+    b = Xty / count - x_mean * y_mean
+    return _lasso_from_gram(G, b, x_mean, y_mean, alpha, num_iterations, tol, theta)
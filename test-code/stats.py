@@ -1,4 +1,5 @@
 import numpy as np
+import pandas as pd
 
 def mean(data):
     return np.mean(data)
@@ -13,11 +14,175 @@ def standard_deviation(data):
     return np.std(data)
 
 def skewness(data):
+    data = np.asarray(data, dtype=float)
     mean_val = np.mean(data)
     n = len(data)
     return (np.sum((data - mean_val)**3) / n) / (np.std(data)**3)
 
 def kurtosis(data):
+    data = np.asarray(data, dtype=float)
     mean_val = np.mean(data)
     n = len(data)
-    return (np.sum((data - mean_val)**4) / n) / (np.std(data)**4) - 3
\ No newline at end of file
+    return (np.sum((data - mean_val)**4) / n) / (np.std(data)**4) - 3
+
+
+class QuantileSketch:
+    def __init__(self, capacity=4096, seed=None):
+        """Approximate quantiles in bounded memory: level h keeps samples that each stand for 2**h values."""
+        self.capacity = capacity
+        self.levels = [np.empty(0)]
+        self.rng = np.random.default_rng(seed)
+
+    def update(self, values):
+        """Add a chunk of values."""
+        self.levels[0] = np.concatenate((self.levels[0], np.asarray(values, dtype=float).ravel()))
+        self._compact()
+
+    def merge(self, other):
+        """Fold in a sketch built over other data, e.g. by a worker process."""
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for h, values in enumerate(other.levels):
+            self.levels[h] = np.concatenate((self.levels[h], values))
+        self._compact()
+        return self
+
+    def _compact(self):
+        """Halve every full level into the next one, keeping every other sorted value."""
+        h = 0
+        while h < len(self.levels):
+            if len(self.levels[h]) > self.capacity:
+                data = np.sort(self.levels[h])
+                # An odd value out stays behind so the total weight is preserved
+                self.levels[h] = data[len(data) - len(data) % 2:]
+                promoted = data[self.rng.integers(2):len(data) - len(data) % 2:2]
+                if h + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                self.levels[h + 1] = np.concatenate((self.levels[h + 1], promoted))
+            h += 1
+
+    def quantile(self, q):
+        """Return the approximate q-quantile (q may be an array)."""
+        values = np.concatenate(self.levels)
+        if len(values) == 0:
+            return np.nan
+        weights = np.concatenate([np.full(len(level), 2.0 ** h) for h, level in enumerate(self.levels)])
+        order = np.argsort(values)
+        cumulative = np.cumsum(weights[order])
+        index = np.searchsorted(cumulative, np.asarray(q) * cumulative[-1])
+        return values[order][np.minimum(index, len(values) - 1)]
+
+
+class MomentAccumulator:
+    def __init__(self, quantile_capacity=4096):
+        """Count, mean, central moments, min and max of a stream of chunks, NaN values are skipped."""
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.m3 = 0.0
+        self.m4 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+        self.sketch = QuantileSketch(quantile_capacity) if quantile_capacity else None
+
+    def update(self, chunk):
+        """Add a chunk of values in one vectorized pass."""
+        values = np.asarray(chunk, dtype=float).ravel()
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return self
+
+        other = MomentAccumulator(quantile_capacity=None)
+        other.count = len(values)
+        other.mean = values.mean()
+        deviations = values - other.mean
+        squares = deviations * deviations
+        other.m2 = squares.sum()
+        other.m3 = squares.dot(deviations)
+        other.m4 = squares.dot(squares)
+        other.min = values.min()
+        other.max = values.max()
+        self._combine(other)
+        if self.sketch is not None:
+            self.sketch.update(values)
+        return self
+
+    def merge(self, other):
+        """Fold in the accumulator of another chunk range or worker process."""
+        self._combine(other)
+        if self.sketch is not None and other.sketch is not None:
+            self.sketch.merge(other.sketch)
+        return self
+
+    def _combine(self, other):
+        """Pairwise update of the central moments (Terriberry / Pebay)."""
+        if other.count == 0:
+            return
+        n_a, n_b = self.count, other.count
+        n = n_a + n_b
+        delta = other.mean - self.mean
+        delta_n = delta / n
+
+        m4 = (self.m4 + other.m4
+              + delta * delta_n ** 3 * n_a * n_b * (n_a * n_a - n_a * n_b + n_b * n_b)
+              + 6 * delta_n ** 2 * (n_a * n_a * other.m2 + n_b * n_b * self.m2)
+              + 4 * delta_n * (n_a * other.m3 - n_b * self.m3))
+        m3 = (self.m3 + other.m3
+              + delta * delta_n ** 2 * n_a * n_b * (n_a - n_b)
+              + 3 * delta_n * (n_a * other.m2 - n_b * self.m2))
+        self.m2 = self.m2 + other.m2 + delta * delta_n * n_a * n_b
+        self.m3 = m3
+        self.m4 = m4
+        self.mean = self.mean + delta_n * n_b
+        self.count = n
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def variance(self):
+        """Population variance, like np.var."""
+        return self.m2 / self.count if self.count else np.nan
+
+    def standard_deviation(self):
+        """Population standard deviation, like np.std."""
+        return np.sqrt(self.variance())
+
+    def skewness(self):
+        """Same definition as skewness()."""
+        return np.sqrt(self.count) * self.m3 / self.m2 ** 1.5 if self.m2 else np.nan
+
+    def kurtosis(self):
+        """Excess kurtosis, same definition as kurtosis()."""
+        return self.count * self.m4 / self.m2 ** 2 - 3 if self.m2 else np.nan
+
+    def quantile(self, q):
+        """Approximate q-quantile from the sketch."""
+        return self.sketch.quantile(q) if self.sketch is not None else np.nan
+
+    def median(self):
+        """Approximate median from the sketch."""
+        return self.quantile(0.5)
+
+    def summary(self):
+        """All statistics as a dict."""
+        return {
+            'count': self.count,
+            'mean': self.mean if self.count else np.nan,
+            'variance': self.variance(),
+            'standard_deviation': self.standard_deviation(),
+            'skewness': self.skewness(),
+            'kurtosis': self.kurtosis(),
+            'min': self.min,
+            'max': self.max,
+            'median': self.median(),
+        }
+
+def summarize_chunks(chunks, quantile_capacity=4096):
+    accumulator = MomentAccumulator(quantile_capacity)
+    for chunk in chunks:
+        accumulator.update(chunk)
+    return accumulator
+
+def summarize_csv(path, column, chunk_size=1_000_000):
+    # One read of the file, only one chunk of the column is in memory at a time
+    chunks = pd.read_csv(path, usecols=[column], chunksize=chunk_size)
+    return summarize_chunks(chunk[column].to_numpy(dtype=float) for chunk in chunks).summary()
@@ -0,0 +1,45 @@
+# tests/test_columnar.py
+import os
+import tempfile
+import unittest
+from tasks.columnar import TaskColumns
+from tasks.repository import TaskRepository
+
+class TestTaskColumns(unittest.TestCase):
+    def setUp(self):
+        self.repository = TaskRepository()
+        for i in range(20):
+            self.repository.add(f"Täsk {i}", ("Low", "Medium", "High")[i % 3])
+        self.repository.complete(4)
+        self.repository.delete(7)
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "tasks.col")
+
+    def test_columns_match_tasks(self):
+        columns = TaskColumns.from_tasks(self.repository)
+        self.assertEqual(list(columns), list(self.repository))
+        self.assertTrue(columns.is_completed(3))
+
+    def test_save_and_memory_map(self):
+        TaskColumns.from_tasks(self.repository).save(self.path)
+        with TaskColumns.load(self.path) as columns:
+            self.assertEqual(len(columns), 19)
+            self.assertEqual(list(columns), list(self.repository))
+            with self.assertRaises(TypeError):
+                columns.complete(0)
+
+    def test_writable_map_updates_file(self):
+        TaskColumns.from_tasks(self.repository).save(self.path)
+        with TaskColumns.load(self.path, writable=True) as columns:
+            columns.complete(18)
+        with TaskColumns.load(self.path) as columns:
+            self.assertTrue(columns[18]["completed"])
+            self.assertEqual(columns[18]["id"], 20)
+
+    def test_plain_task_dicts_get_positions_as_ids(self):
+        columns = TaskColumns.from_tasks([{"name": "Old", "completed": False, "priority": "Urgent"}])
+        self.assertEqual(columns[0], {"id": 1, "name": "Old", "completed": False, "priority": "Medium"})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+# tests/test_data_cleaning.py
+import os
+import sys
+import unittest
+
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError:
+    raise unittest.SkipTest("numpy and pandas are not installed")
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "test-code"))
+from data_cleaning import outlier_mask, remove_outliers, normalize_data, fill_missing_values
+
+class TestDataCleaning(unittest.TestCase):
+    def setUp(self):
+        self.data = [10.0, 12.0, np.nan, 11.0, 13.0, 12.0, 11.0, 10.0, 100.0]
+
+    def test_outlier_mask_keeps_nan_rows(self):
+        mask = outlier_mask(self.data)
+        self.assertTrue(mask[2])
+        self.assertFalse(mask[-1])
+        cleaned = remove_outliers(self.data)
+        self.assertEqual(len(cleaned), 8)
+        # The NaN survives, so it can still be filled afterwards
+        self.assertAlmostEqual(fill_missing_values(cleaned)[2], np.nanmean(cleaned))
+
+    def test_all_outliers_raises(self):
+        with self.assertRaises(ValueError):
+            remove_outliers([1.0, 3.0], n_std=0.5)
+
+    def test_two_dimensional_input_is_cleaned_per_column(self):
+        X = np.array([[1.0, 100.0], [2.0, 200.0], [3.0, np.nan], [4.0, 400.0]])
+        np.testing.assert_allclose(normalize_data(X), [[0, 0], [1 / 3, 1 / 3], [2 / 3, np.nan], [1, 1]])
+        np.testing.assert_allclose(fill_missing_values(X, method="median")[2], [3.0, 200.0])
+        np.testing.assert_allclose(fill_missing_values(X, method="zero")[2], [3.0, 0.0])
+        # A row is removed if any of its columns is out of range
+        X = np.column_stack((np.r_[np.zeros(20), 50.0], np.r_[np.ones(20), 1.0]))
+        self.assertEqual(outlier_mask(X).tolist(), [True] * 20 + [False])
+
+    def test_pandas_index_is_kept(self):
+        series = pd.Series(self.data, index=list("abcdefghi"), name="value")
+        cleaned = remove_outliers(series)
+        self.assertEqual(list(cleaned.index), list("abcdefgh"))
+        filled = fill_missing_values(cleaned)
+        self.assertEqual(list(filled.index), list("abcdefgh"))
+        self.assertEqual(filled.name, "value")
+        frame = pd.DataFrame({"a": [1.0, 2.0, 3.0], "b": [3.0, np.nan, 9.0]}, index=[10, 20, 30])
+        normalized = normalize_data(frame)
+        self.assertEqual(list(normalized.index), [10, 20, 30])
+        self.assertEqual(list(normalized.columns), ["a", "b"])
+
+    def test_inplace_on_float_data(self):
+        array = np.array([1.0, np.nan, 3.0])
+        self.assertIs(fill_missing_values(array, inplace=True), array)
+        np.testing.assert_allclose(array, [1.0, 2.0, 3.0])
+        series = pd.Series([2.0, 4.0, 6.0])
+        self.assertIs(normalize_data(series, inplace=True), series)
+        self.assertEqual(series.tolist(), [0.0, 0.5, 1.0])
+        frame = pd.DataFrame({"a": [1.0, np.nan], "b": [np.nan, 4.0]})
+        fill_missing_values(frame, method="zero", inplace=True)
+        self.assertEqual(frame.values.tolist(), [[1.0, 0.0], [0.0, 4.0]])
+
+    def test_inplace_on_integer_data_raises(self):
+        for data in (np.array([1, 2, 3]), pd.Series([1, 2, 3]), pd.DataFrame({"a": [1.0, 2.0], "b": [1, 2]}), [1.0, 2.0]):
+            with self.assertRaises(TypeError):
+                normalize_data(data, inplace=True)
+        # Without inplace integer data is converted to float
+        self.assertEqual(normalize_data(pd.Series([1, 2, 3])).tolist(), [0.0, 0.5, 1.0])
+
+    def test_unknown_fill_method(self):
+        with self.assertRaises(ValueError):
+            fill_missing_values(self.data, method="mode")
+
+if __name__ == "__main__":
+    unittest.main()
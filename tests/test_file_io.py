@@ -1,8 +1,27 @@
 # tests/test_file_io.py
+import json
+import os
+import tempfile
 import unittest
-from tasks.file_io import save_tasks, load_tasks
+from unittest import mock
 
-class TestFileIO(unittest.TestCase):
+from tasks import file_io
+from tasks.file_io import save_tasks, load_tasks, load_repository, compact_tasks
+from tasks.manager import add_task, mark_task_completed, delete_task
+
+class TaskFileTestCase(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.tasks_file = os.path.join(directory.name, "tasks.json")
+        self.tasks_log = os.path.join(directory.name, "tasks.log")
+        for name, value in (("TASKS_FILE", self.tasks_file), ("TASKS_LOG", self.tasks_log)):
+            patcher = mock.patch.object(file_io, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+
+class TestFileIO(TaskFileTestCase):
     def test_save_tasks(self):
         tasks = [{"name": "Test Task", "completed": False, "priority": "Medium"}]
         result = save_tasks(tasks)
@@ -12,5 +31,160 @@ class TestFileIO(unittest.TestCase):
         tasks = load_tasks()
         self.assertIsInstance(tasks, list)
 
+
+class TestTaskLog(TaskFileTestCase):
+
+    def read_log(self):
+        with open(self.tasks_log) as file:
+            return [json.loads(line) for line in file]
+
+    def test_save_appends_only_changes(self):
+        tasks = load_tasks()
+        add_task(tasks, "First", "High")
+        add_task(tasks, "Second", "Low")
+        save_tasks(tasks)
+        snapshot_size = os.path.getsize(self.tasks_file)
+
+        mark_task_completed(tasks, 1)
+        delete_task(tasks, 2)
+        self.assertEqual(save_tasks(tasks), "Tasks saved successfully!")
+        self.assertEqual(os.path.getsize(self.tasks_file), snapshot_size)
+        self.assertEqual([op["op"] for op in self.read_log()], ["complete", "delete"])
+
+    def test_load_replays_snapshot_and_log(self):
+        tasks = load_tasks()
+        for name in ("A", "B", "C"):
+            add_task(tasks, name, "Medium")
+        save_tasks(tasks)
+        delete_task(tasks, 1)
+        mark_task_completed(tasks, 2)
+        add_task(tasks, "D", "High")
+        save_tasks(tasks)
+
+        loaded = load_tasks()
+        self.assertEqual(loaded, tasks)
+        self.assertEqual([task["name"] for task in loaded], ["B", "C", "D"])
+        self.assertTrue(loaded[1]["completed"])
+
+    def test_torn_last_line_is_ignored(self):
+        tasks = load_tasks()
+        add_task(tasks, "Kept", "Low")
+        save_tasks(tasks)
+        add_task(tasks, "Logged", "Low")
+        save_tasks(tasks)
+        with open(self.tasks_log, "a") as file:
+            file.write('{"op": "add", "task": {"na')
+
+        loaded = load_tasks()
+        self.assertEqual([task["name"] for task in loaded], ["Kept", "Logged"])
+        # The next save rewrites the snapshot instead of appending after the torn line
+        add_task(loaded, "After crash", "High")
+        save_tasks(loaded)
+        self.assertEqual(os.path.getsize(self.tasks_log), 0)
+        self.assertEqual([task["name"] for task in load_tasks()], ["Kept", "Logged", "After crash"])
+
+    def test_compaction_truncates_log(self):
+        tasks = load_tasks()
+        add_task(tasks, "Only", "Low")
+        save_tasks(tasks)
+        with mock.patch.object(file_io, "COMPACT_AFTER", 2):
+            for _ in range(3):
+                mark_task_completed(tasks, 1)
+                save_tasks(tasks)
+        self.assertEqual(os.path.getsize(self.tasks_log), 0)
+        self.assertEqual(load_tasks(), tasks)
+
+    def test_stale_log_after_compaction_is_skipped(self):
+        tasks = load_tasks()
+        add_task(tasks, "A", "Low")
+        save_tasks(tasks)
+        add_task(tasks, "B", "Low")
+        save_tasks(tasks)
+        with open(self.tasks_log) as file:
+            stale_log = file.read()
+
+        compact_tasks(tasks)
+        # A crash between the snapshot rename and the log truncate leaves the old log behind
+        with open(self.tasks_log, "w") as file:
+            file.write(stale_log)
+        self.assertEqual([task["name"] for task in load_tasks()], ["A", "B"])
+
+    def test_repository_logs_task_ids(self):
+        tasks = load_repository()
+        for name in ("A", "B", "C"):
+            add_task(tasks, name, "Medium")
+        save_tasks(tasks)
+        delete_task(tasks, 3)
+        mark_task_completed(tasks, 2)
+        save_tasks(tasks)
+        self.assertEqual([(op["op"], op["id"]) for op in self.read_log()], [("delete", 3), ("complete", 2)])
+
+        loaded = load_repository()
+        self.assertEqual(loaded, tasks)
+        compact_tasks(loaded)
+        # The ID of the deleted task is not handed out again after a reload
+        self.assertEqual(load_repository().add("D", "Low")["id"], 4)
+
+    def test_save_after_another_session_is_refused(self):
+        tasks = load_tasks()
+        add_task(tasks, "Shared", "Low")
+        save_tasks(tasks)
+        first, second = load_tasks(), load_tasks()
+        add_task(first, "From first", "High")
+        save_tasks(first)
+
+        mark_task_completed(second, 1)
+        self.assertTrue(save_tasks(second).startswith("Error saving tasks"))
+        reloaded = load_tasks()
+        self.assertEqual([task["name"] for task in reloaded], ["Shared", "From first"])
+        mark_task_completed(reloaded, 1)
+        self.assertEqual(save_tasks(reloaded), "Tasks saved successfully!")
+
+    def test_first_save_does_not_overwrite_a_new_file(self):
+        first, second = load_tasks(), load_tasks()
+        add_task(first, "From first", "High")
+        save_tasks(first)
+        add_task(second, "From second", "Low")
+        self.assertTrue(save_tasks(second).startswith("Error saving tasks"))
+        self.assertEqual([task["name"] for task in load_tasks()], ["From first"])
+
+    def test_repository_merges_another_sessions_changes(self):
+        tasks = load_repository()
+        for name in ("Shared", "Done elsewhere", "Deleted elsewhere"):
+            add_task(tasks, name, "Low")
+        save_tasks(tasks)
+        first, second = load_repository(), load_repository()
+        add_task(first, "From first", "High")
+        mark_task_completed(first, 2)
+        delete_task(first, 3)
+        save_tasks(first)
+
+        add_task(second, "From second", "Medium")
+        mark_task_completed(second, 1)
+        delete_task(second, 3)
+        self.assertEqual(save_tasks(second), "Tasks saved successfully, together with the changes of another session!")
+        # The ID 4 was taken by the first session, so the second session's task gets the next one
+        self.assertEqual([(task["id"], task["name"], task["completed"]) for task in second],
+                         [(1, "Shared", True), (2, "Done elsewhere", True), (4, "From first", False), (5, "From second", False)])
+        self.assertEqual(load_repository(), second)
+
+        # The merged session keeps appending to the log as usual
+        mark_task_completed(second, 5)
+        self.assertEqual(save_tasks(second), "Tasks saved successfully!")
+        self.assertTrue(load_repository().get(5)["completed"])
+
+    def test_repository_first_save_merges_a_new_file(self):
+        first, second = load_repository(), load_repository()
+        add_task(first, "From first", "High")
+        save_tasks(first)
+        add_task(second, "From second", "Low")
+        save_tasks(second)
+        self.assertEqual([(task["id"], task["name"]) for task in load_repository()], [(1, "From first"), (2, "From second")])
+
+    def test_plain_list_file_still_loads(self):
+        with open(self.tasks_file, "w") as file:
+            json.dump([{"name": "Old", "completed": False, "priority": "Medium"}], file)
+        self.assertEqual([task["name"] for task in load_tasks()], ["Old"])
+
 if __name__ == "__main__":
     unittest.main()
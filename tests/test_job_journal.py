@@ -0,0 +1,43 @@
+# tests/test_job_journal.py
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".continue", "prompts"))
+from job_journal import JobJournal
+
+class TestJobJournal(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "runs", "journal.jsonl")
+
+    def test_replays_finished_cells(self):
+        with JobJournal(self.path) as journal:
+            journal.record(("port.prompt", "granite3.1:8b"), {"content": "answer"})
+            self.assertIn(("port.prompt", "granite3.1:8b"), journal)
+
+        with JobJournal(self.path) as journal:
+            self.assertIn(("port.prompt", "granite3.1:8b"), journal)
+            self.assertNotIn(("port.prompt", "llama3.2"), journal)
+            self.assertEqual(journal.get(("port.prompt", "granite3.1:8b")), {"content": "answer"})
+            self.assertIsNone(journal.get(("lambda.prompt", "granite3.1:8b")))
+
+    def test_partial_last_line_is_skipped(self):
+        with JobJournal(self.path) as journal:
+            journal.record(("port.prompt", "llama3.2"), {"content": "kept"})
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.write('{"prompt": "lambda.prompt", "model": "llama3.2", "res')
+
+        with JobJournal(self.path) as journal:
+            self.assertIn(("port.prompt", "llama3.2"), journal)
+            self.assertNotIn(("lambda.prompt", "llama3.2"), journal)
+            journal.record(("lambda.prompt", "llama3.2"), {"content": "retried"})
+
+        # The retried cell is not glued onto the partial line
+        with JobJournal(self.path) as journal:
+            self.assertEqual(journal.get(("lambda.prompt", "llama3.2")), {"content": "retried"})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,7 @@
 # tests/test_manager.py
 import unittest
-from tasks.manager import add_task, view_tasks, mark_task_completed, delete_task
+from tasks.manager import add_task, view_tasks, mark_task_completed, delete_task, iter_task_lines
+from tasks.repository import TaskRepository
 
 class TestManager(unittest.TestCase):
     def test_add_task(self):
@@ -14,5 +15,43 @@ class TestManager(unittest.TestCase):
         result = view_tasks(tasks)
         self.assertIn("Test Task", result)
 
+    def test_repository_uses_task_ids(self):
+        tasks = TaskRepository()
+        add_task(tasks, "First", "High")
+        add_task(tasks, "Second", "Low")
+        add_task(tasks, "Third", "Medium")
+        self.assertEqual(delete_task(tasks, 2), "Task 'Second' deleted.")
+        self.assertEqual(mark_task_completed(tasks, 3), "Task 'Third' marked as completed!")
+        self.assertEqual(mark_task_completed(tasks, 2), "Invalid task number!")
+        self.assertIn("3. Third [Medium] - Done", view_tasks(tasks))
+
+    def test_list_positions_still_work(self):
+        tasks = []
+        add_task(tasks, "First", "High")
+        add_task(tasks, "Second", "Low")
+        self.assertEqual(delete_task(tasks, 1), "Task 'First' deleted.")
+        self.assertEqual(mark_task_completed(tasks, 1), "Task 'Second' marked as completed!")
+        self.assertEqual(view_tasks(tasks), "1. Second [Low] - Done")
+
+    def test_view_tasks_pages(self):
+        tasks = TaskRepository()
+        for i in range(1, 6):
+            add_task(tasks, f"Task {i}", "Low")
+        self.assertEqual(view_tasks(tasks, page=2, page_size=2).splitlines(),
+                         ["3. Task 3 [Low] - Pending", "4. Task 4 [Low] - Pending", "Page 2 of 3 (5 tasks)"])
+        self.assertEqual(view_tasks(tasks, page=4, page_size=2), "No tasks on page 4.")
+
+    def test_view_tasks_filters_and_sorts(self):
+        for tasks in (TaskRepository(), []):
+            add_task(tasks, "Chore", "Low")
+            add_task(tasks, "Urgent", "High")
+            add_task(tasks, "Normal", "Medium")
+            mark_task_completed(tasks, 2)
+            self.assertEqual([line.split(". ")[1] for line in iter_task_lines(tasks, sort_by="priority")],
+                             ["Urgent [High] - Done", "Normal [Medium] - Pending", "Chore [Low] - Pending"])
+            self.assertEqual(list(iter_task_lines(tasks, completed=True)), ["2. Urgent [High] - Done"])
+            self.assertEqual(view_tasks(tasks, page=1, priority="Low", completed=False).splitlines()[-1],
+                             "Page 1, last page")
+
 if __name__ == "__main__":
     unittest.main()
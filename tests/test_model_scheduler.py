@@ -0,0 +1,59 @@
+# tests/test_model_scheduler.py
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".continue", "prompts"))
+from response_cache import ResponseCache
+
+try:
+    import run_multi_prompt
+    from model_scheduler import plan_waves
+except ImportError:
+    raise unittest.SkipTest("requests is not installed")
+
+class TestPlanWaves(unittest.TestCase):
+    def test_one_model_per_wave_without_budget(self):
+        self.assertEqual(plan_waves(["a", "b", "c"], {}), [["a"], ["b"], ["c"]])
+
+    def test_budget_lets_models_share_a_wave(self):
+        self.assertEqual(plan_waves(["a", "b", "c"], {"a": 3, "b": 2, "c": 1}, 4), [["a", "c"], ["b"]])
+
+
+class TestLoadModels(unittest.TestCase):
+    def test_models_listed_twice_are_loaded_once(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        first, second = os.path.join(directory.name, "first.json"), os.path.join(directory.name, "second.json")
+        with open(first, "w") as file:
+            json.dump({"models": [{"model": "a", "title": "A"}, {"model": "b"}]}, file)
+        with open(second, "w") as file:
+            json.dump({"models": [{"model": "a", "title": "Other A"}, {"model": "c"}]}, file)
+        models = run_multi_prompt.load_models([first, second, first])
+        self.assertEqual([(model["model"], model.get("title")) for model in models], [("a", "A"), ("b", None), ("c", None)])
+
+
+class TestRunInWaves(unittest.TestCase):
+    def test_cached_models_are_not_warmed_up(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        cache = ResponseCache(directory.name)
+        jobs = [("cached", 0, -1, 0.9, 0, 0, "user", "system"), ("missing", 0, -1, 0.9, 0, 0, "user", "system")]
+        cells = [("port.prompt", "cached"), ("port.prompt", "missing")]
+        cache.put(ResponseCache.make_key("cached", 0, -1, 0.9, 0, 0, "system", "user"), {"content": "answer"})
+        self.assertTrue(run_multi_prompt.is_answered(jobs[0], cells[0], cache))
+        self.assertFalse(run_multi_prompt.is_answered(jobs[1], cells[1], cache))
+
+        answer = {"model": "missing", "content": "fresh"}
+        with mock.patch.object(run_multi_prompt, "warm_up") as warm_up, \
+             mock.patch.object(run_multi_prompt, "unload"), \
+             mock.patch.object(run_multi_prompt, "post_chat", return_value=answer):
+            results = dict(run_multi_prompt.run_in_waves(jobs, cells, url="http://127.0.0.1:9/api/chat", cache=cache))
+        self.assertEqual([call.args[2] for call in warm_up.call_args_list], ["missing"])
+        self.assertEqual((results[0]["content"], results[1]["content"]), ("answer", "fresh"))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+# tests/test_regression.py
+import os
+import sys
+import unittest
+
+try:
+    import numpy as np
+except ImportError:
+    raise unittest.SkipTest("numpy is not installed")
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "test-code"))
+from regression import (linear_regression, predict, ridge_regression, lasso_regression, iter_chunks,
+                        linear_regression_chunks, lasso_regression_chunks)
+
+class TestRegression(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.X = rng.normal(size=(500, 3))
+        self.theta = np.array([1.5, 2.0, -3.0, 0.5])
+        self.y = self.theta[0] + self.X.dot(self.theta[1:]) + rng.normal(scale=0.01, size=500)
+
+    def test_solvers_agree(self):
+        expected = linear_regression(self.X, self.y)
+        np.testing.assert_allclose(expected, self.theta, atol=0.01)
+        for method in ("qr", "cholesky"):
+            np.testing.assert_allclose(linear_regression(self.X, self.y, method=method), expected)
+        with self.assertRaises(ValueError):
+            linear_regression(self.X, self.y, method="inverse")
+
+    def test_predict_accepts_one_feature(self):
+        theta = linear_regression(self.X[:, 0], self.y)
+        self.assertEqual(predict(self.X[:, 0], theta).shape, (500,))
+
+    def test_ridge_does_not_penalize_the_intercept(self):
+        shifted = ridge_regression(self.X, self.y + 100, alpha=10.0)
+        theta = ridge_regression(self.X, self.y, alpha=10.0)
+        self.assertAlmostEqual(shifted[0] - theta[0], 100, places=6)
+        np.testing.assert_allclose(shifted[1:], theta[1:])
+        np.testing.assert_allclose(ridge_regression(self.X, self.y, alpha=0.0), linear_regression(self.X, self.y))
+
+    def test_lasso(self):
+        np.testing.assert_allclose(lasso_regression(self.X, self.y, alpha=0.0, tol=1e-12), linear_regression(self.X, self.y), atol=1e-8)
+        theta = lasso_regression(self.X, self.y, alpha=1.0)
+        # The small coefficient is shrunk to exactly zero, the intercept is not penalized
+        self.assertEqual(theta[3], 0.0)
+        self.assertAlmostEqual(theta[0], self.y.mean() - self.X.mean(axis=0).dot(theta[1:]))
+
+    def test_lasso_warm_start(self):
+        cold = lasso_regression(self.X, self.y, alpha=0.05, tol=1e-12)
+        warm = lasso_regression(self.X, self.y, alpha=0.05, tol=1e-12, theta=lasso_regression(self.X, self.y, alpha=0.5))
+        np.testing.assert_allclose(warm, cold, atol=1e-9)
+
+    def test_chunked_fits_match_in_memory_fits(self):
+        chunks = lambda: iter_chunks(self.X, self.y, chunk_size=64)
+        np.testing.assert_allclose(linear_regression_chunks(chunks()), linear_regression(self.X, self.y))
+        np.testing.assert_allclose(linear_regression_chunks(chunks(), alpha=10.0), ridge_regression(self.X, self.y, alpha=10.0))
+        np.testing.assert_allclose(lasso_regression_chunks(chunks(), alpha=0.1, tol=1e-12),
+                                   lasso_regression(self.X, self.y, alpha=0.1, tol=1e-12), atol=1e-9)
+        with self.assertRaises(ValueError):
+            linear_regression_chunks(iter([]))
+        with self.assertRaises(ValueError):
+            lasso_regression_chunks(iter([]))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+# tests/test_repository.py
+import unittest
+from tasks.repository import TaskRepository
+
+class TestTaskRepository(unittest.TestCase):
+    def setUp(self):
+        self.repository = TaskRepository()
+        for name, priority in (("Write", "High"), ("Read", "Low"), ("Test", "High"), ("Ship", "Medium")):
+            self.repository.add(name, priority)
+
+    def test_ids_are_stable_after_delete(self):
+        self.repository.delete(2)
+        self.assertNotIn(2, self.repository)
+        self.assertEqual(self.repository.get(3)["name"], "Test")
+        self.assertEqual(self.repository.add("New", "Low")["id"], 5)
+
+    def test_complete_moves_status_index(self):
+        self.repository.complete(3)
+        self.assertEqual([task["name"] for task in self.repository.find(completed=True)], ["Test"])
+        self.assertEqual(self.repository.count(completed=False), 3)
+
+    def test_find_combines_indexes(self):
+        self.repository.complete(1)
+        self.assertEqual([task["name"] for task in self.repository.find(priority="High", completed=False)], ["Test"])
+        self.assertEqual([task["id"] for task in self.repository.find(name="Ship")], [4])
+        self.assertEqual(self.repository.count(priority="High"), 2)
+
+    def test_delete_removes_from_indexes(self):
+        self.repository.delete(1)
+        self.repository.delete(3)
+        self.assertNotIn("High", self.repository.by_priority)
+        self.assertEqual(list(self.repository.find(name="Write")), [])
+        self.assertEqual(len(self.repository), 2)
+
+    def test_invalid_priority_defaults_to_medium(self):
+        self.assertEqual(self.repository.add("Other", "Urgent")["priority"], "Medium")
+
+if __name__ == "__main__":
+    unittest.main()
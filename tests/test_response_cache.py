@@ -0,0 +1,69 @@
+# tests/test_response_cache.py
+import os
+import sys
+import tempfile
+import time
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".continue", "prompts"))
+from response_cache import ResponseCache
+
+try:
+    import run_multi_prompt
+except ImportError:  # Needs requests
+    run_multi_prompt = None
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.cache_dir = directory.name
+
+    def test_key_covers_every_option(self):
+        key = ResponseCache.make_key("model", 0, 150, 0.9, 0, 0, "system", "user")
+        self.assertEqual(key, ResponseCache.make_key("model", 0, 150, 0.9, 0, 0, "system", "user"))
+        self.assertNotEqual(key, ResponseCache.make_key("model", 0.5, 150, 0.9, 0, 0, "system", "user"))
+        self.assertNotEqual(key, ResponseCache.make_key("model", 0, 150, 0.9, 0, 0, "system", "other user"))
+
+    def test_put_get_and_refresh(self):
+        cache = ResponseCache(self.cache_dir)
+        cache.put("key", {"content": "answer"})
+        self.assertEqual(cache.get("key"), {"content": "answer"})
+        self.assertIsNone(cache.get("missing"))
+        self.assertIsNone(ResponseCache(self.cache_dir, refresh=True).get("key"))
+        # A reopened cache still knows the size of its entries
+        self.assertEqual(ResponseCache(self.cache_dir)._total, cache._total)
+
+    def test_evicts_least_recently_used(self):
+        # Each entry is 95 bytes, so three fit
+        cache = ResponseCache(self.cache_dir, max_bytes=300)
+        for i, key in enumerate(("first", "second", "third")):
+            cache.put(key, {"content": "x" * 80})
+            os.utime(cache._path(key), (time.time() - 100 + i, time.time() - 100 + i))
+        # Reading an entry makes it the most recently used one
+        self.assertIsNotNone(cache.get("first"))
+        cache.put("fourth", {"content": "x" * 80})
+
+        self.assertLessEqual(cache._total, 300)
+        self.assertIsNone(cache.get("second"))
+        for key in ("first", "third", "fourth"):
+            self.assertIsNotNone(cache.get(key))
+
+    @unittest.skipIf(run_multi_prompt is None, "requests is not installed")
+    def test_hit_is_marked_as_cached(self):
+        cache = ResponseCache(self.cache_dir)
+        options = ("model", 0, -1, 0.9, 0, 0)
+        key = ResponseCache.make_key(*options, "system", "user")
+        cache.put(key, {"model": "model", "content": "answer", "metrics": {"wall_time": 12.0, "ttft": 3.0}})
+
+        result = run_multi_prompt.request_chat(*options, "user", "system", url="http://127.0.0.1:9/api/chat", cache=cache)
+        self.assertEqual(result["content"], "answer")
+        self.assertTrue(result["metrics"]["cached"])
+        self.assertIsNone(result["metrics"]["ttft"])
+        self.assertLess(result["metrics"]["wall_time"], 12.0)
+        summary = run_multi_prompt.summarize_metrics([result])
+        self.assertEqual((summary["count"], summary["cached"]), (0, 1))
+        self.assertIsNone(summary["wall_time"]["p50"])
+
+if __name__ == "__main__":
+    unittest.main()
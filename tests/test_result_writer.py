@@ -0,0 +1,51 @@
+# tests/test_result_writer.py
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".continue", "prompts"))
+from result_writer import ResultWriter
+
+class TestResultWriter(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.output_path = os.path.join(directory.name, "results", "out.json")
+
+    def test_streams_lines_and_assembles_array(self):
+        records = [{"name": "granite3.1:8b", "prompt": {"assistant": 'Use "quotes"\n\\ and ünicode'}}, {"name": "llama3.2", "error": "500"}]
+        with ResultWriter(self.output_path) as writer:
+            for record in records:
+                writer.write(record)
+            with open(writer.jsonl_path, encoding="utf-8") as file:
+                self.assertEqual([json.loads(line) for line in file], records)
+
+        self.assertEqual(writer.count, 2)
+        self.assertTrue(writer.jsonl_path.endswith("out.jsonl"))
+        with open(self.output_path, encoding="utf-8") as file:
+            self.assertEqual(json.load(file), records)
+
+    def test_empty_output_is_valid_json(self):
+        ResultWriter(self.output_path).close()
+        with open(self.output_path, encoding="utf-8") as file:
+            self.assertEqual(json.load(file), [])
+
+    def test_custom_envelope(self):
+        writer = ResultWriter(self.output_path)
+        writer.write({"user": "Write a quick sort", "assistant": "def quick_sort(arr): ..."})
+        writer.close('{"0": [{"name": "llama3.2", "prompt": [\n', '\n], "metrics_summary": {"count": 1}}]}\n')
+        # Closing again does not rebuild the file
+        writer.close()
+        with open(self.output_path, encoding="utf-8") as file:
+            run = json.load(file)["0"][0]
+        self.assertEqual(run["prompt"][0]["user"], "Write a quick sort")
+        self.assertEqual(run["metrics_summary"], {"count": 1})
+
+    def test_jsonl_output_name_is_rejected(self):
+        with self.assertRaises(ValueError):
+            ResultWriter(os.path.join(os.path.dirname(self.output_path), "out.jsonl"))
+
+if __name__ == "__main__":
+    unittest.main()
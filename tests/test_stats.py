@@ -0,0 +1,82 @@
+# tests/test_stats.py
+import os
+import sys
+import tempfile
+import unittest
+
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError:
+    raise unittest.SkipTest("numpy and pandas are not installed")
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "test-code"))
+from stats import (variance, skewness, kurtosis, QuantileSketch, MomentAccumulator, summarize_chunks,
+                   summarize_csv)
+
+class TestMomentAccumulator(unittest.TestCase):
+    def setUp(self):
+        self.data = np.random.default_rng(0).gamma(2.0, size=10000)
+
+    def assert_matches_data(self, accumulator):
+        self.assertEqual(accumulator.count, len(self.data))
+        self.assertAlmostEqual(accumulator.mean, self.data.mean())
+        self.assertAlmostEqual(accumulator.variance(), variance(self.data))
+        self.assertAlmostEqual(accumulator.skewness(), skewness(self.data))
+        self.assertAlmostEqual(accumulator.kurtosis(), kurtosis(self.data))
+        self.assertEqual((accumulator.min, accumulator.max), (self.data.min(), self.data.max()))
+
+    def test_chunks_match_one_pass(self):
+        self.assert_matches_data(summarize_chunks(np.array_split(self.data, 7)))
+
+    def test_merge_matches_one_pass(self):
+        parts = [summarize_chunks([chunk]) for chunk in np.array_split(self.data, 5)]
+        merged = MomentAccumulator()
+        for part in parts:
+            merged.merge(part)
+        self.assert_matches_data(merged)
+        self.assertLess(abs(merged.median() - np.median(self.data)), 0.05)
+
+    def test_nan_and_empty_input(self):
+        accumulator = MomentAccumulator().update([np.nan, 1.0, 3.0]).update([])
+        self.assertEqual(accumulator.count, 2)
+        self.assertEqual(accumulator.mean, 2.0)
+        self.assertTrue(np.isnan(MomentAccumulator().summary()["mean"]))
+
+    def test_summarize_csv(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "data.csv")
+            pd.DataFrame({"value": self.data}).to_csv(path, index=False)
+            summary = summarize_csv(path, "value", chunk_size=999)
+        self.assertEqual(summary["count"], len(self.data))
+        self.assertAlmostEqual(summary["standard_deviation"], self.data.std())
+
+
+class TestQuantileSketch(unittest.TestCase):
+    def test_small_input_is_exact(self):
+        sketch = QuantileSketch()
+        sketch.update([5, 1, 4, 2, 3])
+        self.assertEqual(sketch.quantile(0.5), 3)
+        self.assertTrue(np.isnan(QuantileSketch().quantile(0.5)))
+
+    def test_bounded_memory_and_accuracy(self):
+        data = np.random.default_rng(1).normal(size=100000)
+        sketch = QuantileSketch(capacity=512, seed=0)
+        for chunk in np.array_split(data, 50):
+            sketch.update(chunk)
+        self.assertTrue(all(len(level) <= 512 for level in sketch.levels))
+        # Every sample stands for 2**level values, so the total weight is preserved
+        self.assertEqual(sum(len(level) * 2 ** h for h, level in enumerate(sketch.levels)), len(data))
+        estimates = sketch.quantile(np.array([0.1, 0.5, 0.9]))
+        ranks = np.searchsorted(np.sort(data), estimates) / len(data)
+        np.testing.assert_allclose(ranks, [0.1, 0.5, 0.9], atol=0.02)
+
+    def test_merge(self):
+        first, second = QuantileSketch(capacity=256, seed=0), QuantileSketch(capacity=256, seed=1)
+        first.update(np.arange(0, 5000))
+        second.update(np.arange(5000, 10000))
+        merged = first.merge(second)
+        self.assertLess(abs(merged.quantile(0.5) - 5000), 200)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+# tests/test_storage.py
+import os
+import tempfile
+import unittest
+from tasks.manager import add_task, mark_task_completed, delete_task
+from tasks.storage import SQLiteBackend, open_backend, JsonFileBackend
+
+class TestSQLiteBackend(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "tasks.sqlite")
+        self.first = SQLiteBackend(self.path)
+        self.second = SQLiteBackend(self.path)
+        self.addCleanup(self.first.close)
+        self.addCleanup(self.second.close)
+
+    def names(self, tasks):
+        return [(task["id"], task["name"], task["completed"]) for task in tasks]
+
+    def test_round_trip_with_row_level_updates(self):
+        tasks = self.first.load()
+        for name in ("A", "B", "C"):
+            add_task(tasks, name, "High")
+        self.assertEqual(self.first.save(tasks), "Tasks saved successfully!")
+        mark_task_completed(tasks, 1)
+        delete_task(tasks, 2)
+        self.assertEqual(self.first.save(tasks), "Tasks saved successfully!")
+        self.assertEqual(tasks.pending, [])
+        self.assertEqual(self.names(self.second.load()), [(1, "A", True), (3, "C", False)])
+
+    def test_wal_mode(self):
+        mode = self.first.connection.execute("PRAGMA journal_mode").fetchone()[0]
+        self.assertEqual(mode, "wal")
+
+    def test_concurrent_sessions_do_not_overwrite_each_other(self):
+        first_tasks = self.first.load()
+        second_tasks = self.second.load()
+        add_task(first_tasks, "First", "Low")
+        add_task(second_tasks, "Second", "Low")
+        self.second.save(second_tasks)
+        self.first.save(first_tasks)
+        # Both sessions handed out ID 1, the later save got a fresh row ID
+        self.assertEqual(self.names(first_tasks), [(2, "First", False)])
+        self.assertEqual(self.names(self.second.load()), [(1, "Second", False), (2, "First", False)])
+
+    def test_renamed_ids_do_not_collide(self):
+        other = self.second.load()
+        add_task(other, "Other", "Low")
+        self.second.save(other)
+        tasks = self.first.load()
+        tasks.next_id = 1
+        add_task(tasks, "X", "Low")
+        add_task(tasks, "Y", "Low")
+        mark_task_completed(tasks, 2)
+        self.first.save(tasks)
+        self.assertEqual(self.names(tasks), [(2, "X", False), (3, "Y", True)])
+        self.assertEqual(self.names(self.second.load()), [(1, "Other", False), (2, "X", False), (3, "Y", True)])
+
+    def test_deleted_ids_are_not_reused(self):
+        tasks = self.first.load()
+        add_task(tasks, "Gone", "Low")
+        self.first.save(tasks)
+        delete_task(tasks, 1)
+        self.first.save(tasks)
+        self.assertEqual(self.first.load().add("New", "Low")["id"], 2)
+
+    def test_ids_deleted_by_another_session_are_not_reused(self):
+        late = self.second.load()
+        tasks = self.first.load()
+        add_task(tasks, "Gone", "Low")
+        self.first.save(tasks)
+        delete_task(tasks, 1)
+        self.first.save(tasks)
+        add_task(late, "Late", "Low")
+        self.second.save(late)
+        self.assertEqual(self.names(late), [(2, "Late", False)])
+        self.assertEqual(self.names(self.first.load()), [(2, "Late", False)])
+
+    def test_failed_save_rolls_back(self):
+        tasks = self.first.load()
+        add_task(tasks, "Kept", "Low")
+        tasks.pending.append({"op": "unknown", "id": 1})
+        self.assertTrue(self.first.save(tasks).startswith("Error saving tasks"))
+        self.assertEqual(self.second.load().count(), 0)
+
+    def test_open_backend(self):
+        self.assertIsInstance(open_backend("json"), JsonFileBackend)
+        with self.assertRaises(ValueError):
+            open_backend("csv")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+# tests/test_token_budget.py
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".continue", "prompts"))
+from token_budget import estimate_tokens, trim_to_budget, pack_user_message
+
+class TestTokenBudget(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.root = directory.name
+        with open(os.path.join(self.root, "small.py"), "w") as file:
+            file.write("def add(a, b):\n    return a + b\n")
+        with open(os.path.join(self.root, "large.py"), "w") as file:
+            file.write("\n".join(f"value_{i} = {i}" for i in range(2000)))
+
+    def test_message_without_attachments_is_unchanged(self):
+        message, report = pack_user_message("Explain @missing.py", "system", 4096, root=self.root)
+        self.assertEqual(message, "Explain @missing.py")
+        self.assertEqual(report["attachment_tokens"], 0)
+        self.assertEqual(report["output_tokens"], 150)
+
+    def test_attachment_is_inlined_before_the_message(self):
+        message, report = pack_user_message("Review @small.py", "system", 4096, max_tokens=500, root=self.root)
+        self.assertEqual(message, "```small.py\ndef add(a, b):\n    return a + b\n\n```\n\nReview @small.py")
+        self.assertEqual(report["trimmed"], [])
+        self.assertEqual(report["total_tokens"], report["system_tokens"] + report["user_tokens"] + report["attachment_tokens"] + 500)
+
+    def test_large_attachment_is_trimmed_to_the_context(self):
+        message, report = pack_user_message("Document @large.py and @small.py", "system", 1024, root=self.root)
+        self.assertEqual(report["trimmed"], ["large.py"])
+        self.assertLessEqual(report["total_tokens"], 1024)
+        self.assertIn("more lines trimmed", message)
+        self.assertIn("return a + b", message)
+
+    def test_unknown_context_length_keeps_everything(self):
+        message, report = pack_user_message("Document @large.py", "system", None, root=self.root)
+        self.assertEqual(report["trimmed"], [])
+        self.assertIn("value_1999 = 1999", message)
+
+    def test_trim_to_budget(self):
+        text = "one two\nthree four\nfive six"
+        self.assertEqual(trim_to_budget(text, 100), text)
+        trimmed = trim_to_budget(text, estimate_tokens("one two") + 1)
+        self.assertEqual(trimmed.splitlines(), ["one two", "# ... 2 more lines trimmed to fit the context window"])
+
+if __name__ == "__main__":
+    unittest.main()